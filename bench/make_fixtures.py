@@ -0,0 +1,93 @@
+"""
+Membuat halaman fixture (hasil pencarian dan detail artikel) bergaya MDPI untuk
+benchmark dari data artikel yang sudah pernah di-scrape.
+
+Penggunaan: python -m bench.make_fixtures [output/mdpi_....json]
+"""
+import html
+import json
+import os
+import sys
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_SOURCE = os.path.join(os.path.dirname(FIXTURES_DIR), "..", "output", "mdpi_computer_science_2020-2025.json")
+
+SEARCH_PAGES = 3
+ITEMS_PER_PAGE = 50
+
+# Boilerplate navigasi dan script agar ukuran halaman mendekati halaman MDPI asli
+BOILERPLATE = "\n".join(
+    f'<li class="menu-item"><a href="/journal/{i}">Journal {i}</a></li>' for i in range(400)
+) + "\n<script>" + "var mdpiConfig = {};\n" * 2000 + "</script>"
+
+
+def page(title, body):
+    return (f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head>\n"
+            f"<body>\n<nav><ul>{BOILERPLATE}</ul></nav>\n{body}\n<footer>MDPI stand-in</footer>\n</body></html>\n")
+
+
+def article_page(record, index):
+    keywords = "; ".join(word.strip(",.:").lower() for word in record["title"].split()[:6])
+    if isinstance(record["full_content"], dict) and "full_content" not in record["full_content"]:
+        sections = "\n".join(
+            f"<section><h2>{html.escape(title)}</h2>\n<div class=\"html-p\">{html.escape(text)}</div></section>"
+            for title, text in record["full_content"].items()
+        )
+    else:
+        # Artikel tanpa heading: seluruh teks menjadi satu blok
+        sections = f"<div class=\"html-p\">{html.escape(record['full_content'].get('full_content', ''))}</div>"
+    references = "\n".join(
+        f"<li>Author {i}. Reference title {i} for fixture {index}. J. Bench. 2024, {i}, 1-10.</li>"
+        for i in range(1, 41)
+    )
+    body = f"""<article>
+<h1 class="title">{html.escape(record['title'])}</h1>
+<div class="art-authors">{html.escape(record['authors'])}</div>
+<div class="html-abstract"><div class="html-p">Abstract {html.escape(record['abstract'])}</div></div>
+<div class="art-keywords"><span>Keywords</span> {html.escape(keywords)}</div>
+<div class="html-body">
+{sections}
+</div>
+<div class="html-back"><div class="html-references"><ol>
+{references}
+</ol></div></div>
+</article>"""
+    return page(record["title"], body)
+
+
+def search_page(records, page_no):
+    items = []
+    for i in range(ITEMS_PER_PAGE):
+        number = (page_no - 1) * ITEMS_PER_PAGE + i
+        record = records[number % len(records)]
+        items.append(f"""<div class="generic-item article-item">
+<a class="title-link" href="/bench/article/{number}">{html.escape(record['title'])} #{number}</a>
+<div class="authors">{html.escape(record['authors'])}</div>
+<div class="color-grey-dark">Bench 2025, 1({page_no}), {number}; https://doi.org/10.3390/bench{number} - 1 Dec 2025</div>
+<div class="abstract-div">
+<div class="abstract-cropped inline">Abstract {html.escape(record['abstract'][:250])}<a href="#" class="read-more-link">[...] Read more.</a></div>
+<div class="abstract-full inline" style="display: none;">Abstract {html.escape(record['abstract'])}<a href="/bench/article/{number}">Full article</a></div>
+</div>
+</div>""")
+    return page(f"Search page {page_no}", '<div class="article-listing">\n' + "\n".join(items) + "\n</div>")
+
+
+def main(source):
+    with open(source, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for i, record in enumerate(records):
+        with open(os.path.join(FIXTURES_DIR, f"article_{i}.html"), 'w', encoding='utf-8') as f:
+            f.write(article_page(record, i))
+    for page_no in range(1, SEARCH_PAGES + 1):
+        with open(os.path.join(FIXTURES_DIR, f"search_{page_no}.html"), 'w', encoding='utf-8') as f:
+            f.write(search_page(records, page_no))
+    with open(os.path.join(FIXTURES_DIR, "search_empty.html"), 'w', encoding='utf-8') as f:
+        f.write(page("No results", '<div class="article-listing"><p>No results found.</p></div>'))
+
+    print(f"[✓] {len(records)} halaman artikel dan {SEARCH_PAGES} halaman pencarian ditulis ke '{FIXTURES_DIR}'")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else os.path.normpath(DEFAULT_SOURCE))
@@ -0,0 +1,253 @@
+"""
+Benchmark scraper terhadap server fixture lokal (tanpa mengakses MDPI asli).
+
+    python -m bench.run_bench                       # semua mode yang bisa dijalankan
+    python -m bench.run_bench --modes parse http    # mode tertentu saja
+    python -m bench.run_bench --save-baseline       # simpan hasil sebagai baseline
+    python -m bench.run_bench --compare             # bandingkan dengan baseline
+
+Mode:
+    parse     waktu parse per halaman fixture (tanpa jaringan), termasuk halaman
+              MDPI asli di fixtures/real jika ada (lihat bench/save_real_pages.py)
+    http      jalur HTTP: fetch_article_html_http + extract_article_content
+    selenium  get_full_article_content dengan Chrome headless
+    crawl     scrape_mdpi penuh terhadap server fixture
+"""
+import argparse
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import main
+from http_fetcher import HttpFetcher
+from parsers import extract_article_content, parse_search_page, parse_search_item
+from bench.save_real_pages import REAL_FIXTURES_DIR
+from bench.server import FIXTURES_DIR, FixtureServer
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+ALL_MODES = ["parse", "http", "selenium", "crawl"]
+
+
+def peak_rss_mb():
+    """
+    Peak RSS proses ini dan proses anak (parser) dalam MB, None jika tidak tersedia.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    # ru_maxrss dalam KB di Linux, dalam bytes di macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return own, children
+
+
+def article_urls(base_url, count):
+    return [f"{base_url}/bench/article/{i}" for i in range(count)]
+
+
+def load_pages(fixtures_dir):
+    """
+    Halaman artikel dan halaman pencarian di `fixtures_dir` (.html atau .html.gz).
+    """
+    article_pages, search_pages = [], []
+    if not os.path.isdir(fixtures_dir):
+        return article_pages, search_pages
+    for name in sorted(os.listdir(fixtures_dir)):
+        path = os.path.join(fixtures_dir, name)
+        if not os.path.isfile(path) or not name.endswith((".html", ".html.gz")):
+            continue
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            (article_pages if name.startswith("article_") else search_pages).append(f.read())
+    return article_pages, search_pages
+
+
+def bench_parse(repeat):
+    """
+    Rata-rata waktu parse per halaman artikel dan halaman pencarian fixture,
+    dan per halaman MDPI asli jika ada.
+    """
+    results = parse_timings(*load_pages(FIXTURES_DIR), repeat)
+    real_article_pages, real_search_pages = load_pages(REAL_FIXTURES_DIR)
+    if real_article_pages and real_search_pages:
+        real = parse_timings(real_article_pages, real_search_pages, repeat)
+        results.update({f"real_{name}": value for name, value in real.items()})
+    return results
+
+
+def parse_timings(article_pages, search_pages, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in article_pages:
+            extract_article_content(html)
+    article_ms = (time.perf_counter() - started) / (repeat * len(article_pages)) * 1000
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in search_pages:
+            _, article_items = parse_search_page(html)
+            [parse_search_item(item) for item in article_items]
+    search_ms = (time.perf_counter() - started) / (repeat * len(search_pages)) * 1000
+
+    return {"article_ms_per_page": article_ms, "search_ms_per_page": search_ms}
+
+
+def bench_http(base_url, count):
+    """
+    Throughput jalur HTTP (fetch + ekstraksi) secara berurutan.
+    """
+    fetcher = HttpFetcher(pool_size=1)
+    started = time.perf_counter()
+    for url in article_urls(base_url, count):
+        html = main.fetch_article_html_http(fetcher, url)
+        extract_article_content(html)
+    elapsed = time.perf_counter() - started
+    fetcher.close()
+    return {"articles_per_sec": count / elapsed}
+
+
+def bench_selenium(base_url, count):
+    """
+    Throughput get_full_article_content dengan Chrome headless.
+    """
+    driver = main.setup_driver()
+    if not driver:
+        return None
+    try:
+        started = time.perf_counter()
+        for url in article_urls(base_url, count):
+            main.get_full_article_content(driver, url)
+        elapsed = time.perf_counter() - started
+    finally:
+        driver.quit()
+    return {"articles_per_sec": count / elapsed}
+
+
+def bench_crawl(base_url, count, num_workers, fetch_mode, parse_workers):
+    """
+    Throughput scrape_mdpi penuh dan jumlah bytes yang ditulis ke output.
+    """
+    output_dir = tempfile.mkdtemp(prefix="mdpi_bench_")
+    try:
+        started = time.perf_counter()
+        filepath = main.scrape_mdpi("bench", 0, count, num_workers=num_workers, fetch_mode=fetch_mode,
+                                    parse_workers=parse_workers, base_url=base_url,
+                                    output_config={"output_dir": output_dir, "cache_dir": None,
+                                                   "search_index": None},
+                                    sync_config={"auto_push": False})
+        elapsed = time.perf_counter() - started
+        if filepath is None:
+            return None
+
+        bytes_written = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(output_dir)
+            for name in files
+            if name.endswith((".jsonl", ".json", ".jsonl.gz"))
+        )
+        return {"articles_per_sec": count / elapsed, "bytes_written": bytes_written}
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def compare(results, baseline, tolerance):
+    """
+    Membandingkan hasil dengan baseline. Metrik `*_per_sec` lebih besar lebih
+    baik, metrik lain lebih kecil lebih baik. Mengembalikan daftar regresi.
+    """
+    regressions = []
+    for mode, metrics in results.items():
+        for name, value in metrics.items():
+            old = baseline.get(mode, {}).get(name)
+            if value is None or not old:
+                continue
+            change = (value - old) / old
+            higher_is_better = name.endswith("_per_sec")
+            regressed = change < -tolerance if higher_is_better else change > tolerance
+            marker = "REGRESI" if regressed else "ok"
+            print(f"    {mode}.{name}: {old:.3f} -> {value:.3f} ({change:+.1%}) {marker}")
+            if regressed:
+                regressions.append(f"{mode}.{name}")
+    return regressions
+
+
+def run(args):
+    server = FixtureServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    base_url = server.start()
+    count = min(args.articles, server.fixtures.article_count)
+    print(f"[*] Server fixture: {base_url} (latensi {args.latency_ms} ms +/- {args.jitter_ms} ms)")
+    print(f"[*] Mode: {', '.join(args.modes)}, {count} artikel")
+    print("-" * 50)
+
+    results = {}
+    try:
+        for mode in args.modes:
+            print(f"[*] Menjalankan mode '{mode}'...")
+            bytes_before = server.bytes_served
+            if mode == "parse":
+                result = bench_parse(args.repeat)
+            elif mode == "http":
+                result = bench_http(base_url, count)
+            elif mode == "selenium":
+                result = bench_selenium(base_url, count)
+            else:
+                result = bench_crawl(base_url, count, args.workers, args.fetch_mode, args.parse_workers)
+
+            if result is None:
+                print(f"[!] Mode '{mode}' dilewati (Chrome/ChromeDriver tidak tersedia)")
+                continue
+            if mode != "parse":
+                result["bytes_served"] = server.bytes_served - bytes_before
+            own_rss, children_rss = peak_rss_mb()
+            if own_rss is not None:
+                result["peak_rss_mb"] = own_rss
+                result["peak_rss_children_mb"] = children_rss
+            results[mode] = result
+    finally:
+        server.stop()
+
+    print("-" * 50)
+    print("[*] Hasil benchmark:")
+    for mode, metrics in results.items():
+        print(f"    {mode}: " + ", ".join(f"{name}={value:.3f}" for name, value in metrics.items()))
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+        print(f"[✓] Baseline disimpan ke '{BASELINE_PATH}'")
+
+    if args.compare:
+        if not os.path.exists(BASELINE_PATH):
+            print(f"[!] Baseline '{BASELINE_PATH}' belum ada, jalankan dengan --save-baseline dulu")
+            return 1
+        with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"[*] Perbandingan dengan baseline (toleransi {args.tolerance:.0%}):")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"[!] Regresi terdeteksi: {', '.join(regressions)}")
+            return 1
+        print("[✓] Tidak ada regresi")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark scraper MDPI terhadap server fixture lokal")
+    parser.add_argument("--modes", nargs="+", choices=ALL_MODES, default=ALL_MODES)
+    parser.add_argument("--articles", type=int, default=100, help="Jumlah artikel per mode")
+    parser.add_argument("--repeat", type=int, default=5, help="Pengulangan parse per halaman fixture")
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--jitter-ms", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=4, help="num_workers untuk mode crawl")
+    parser.add_argument("--fetch-mode", default="http", choices=["http", "selenium"])
+    parser.add_argument("--parse-workers", type=int, default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Batas perubahan relatif sebelum dianggap regresi")
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""
+Menyimpan halaman MDPI asli (apa adanya, termasuk markup yang tidak rapi) ke
+`bench/fixtures/real/` untuk benchmark parse dan pemeriksaan output parser
+(`python parsers.py bench/fixtures/real`). Halaman fixture sintetis dari
+`make_fixtures` selalu well-formed, jadi perbedaan lxml dan html.parser pada
+halaman asli hanya terlihat di sini.
+
+    python -m bench.save_real_pages --from-cache output/html_cache --search 2 --articles 5
+    python -m bench.save_real_pages --url https://www.mdpi.com/2076-3417/15/1/1 ...
+"""
+import argparse
+import gzip
+import os
+
+from html_cache import HtmlCache
+from http_fetcher import HttpFetcher
+
+REAL_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "real")
+
+
+def next_path(kind):
+    """
+    Path file berikutnya untuk jenis halaman `kind` (search/article).
+    """
+    os.makedirs(REAL_FIXTURES_DIR, exist_ok=True)
+    existing = [name for name in os.listdir(REAL_FIXTURES_DIR) if name.startswith(kind + "_")]
+    return os.path.join(REAL_FIXTURES_DIR, f"{kind}_{len(existing)}.html.gz")
+
+
+def save_page(kind, url, html):
+    path = next_path(kind)
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(html)
+    print(f"    ✓ {url} -> {os.path.relpath(path)}")
+    return path
+
+
+def save_from_cache(cache_dir, search_count, article_count):
+    """
+    Menyalin halaman pencarian dan artikel terbaru dari cache HTML crawl asli.
+    """
+    cache = HtmlCache(cache_dir)
+    saved = 0
+    try:
+        for kind, count in (("search", search_count), ("article", article_count)):
+            for url in cache.urls(kind, limit=count):
+                html = cache.get(url, ignore_ttl=True)
+                if html is not None:
+                    save_page(kind, url, html)
+                    saved += 1
+    finally:
+        cache.close()
+    return saved
+
+
+def save_from_urls(urls):
+    """
+    Mengambil halaman langsung dari MDPI lewat HTTP.
+    """
+    fetcher = HttpFetcher(pool_size=1)
+    saved = 0
+    try:
+        for url in urls:
+            status_code, html = fetcher.fetch(url)
+            if status_code != 200:
+                print(f"    [!] {url}: HTTP {status_code}, dilewati")
+                continue
+            save_page("search" if "/search" in url else "article", url, html)
+            saved += 1
+    finally:
+        fetcher.close()
+    return saved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simpan halaman MDPI asli sebagai fixture")
+    parser.add_argument("--from-cache", metavar="CACHE_DIR", help="Folder cache HTML dari crawl asli")
+    parser.add_argument("--search", type=int, default=2, help="Jumlah halaman pencarian dari cache")
+    parser.add_argument("--articles", type=int, default=5, help="Jumlah halaman artikel dari cache")
+    parser.add_argument("--url", nargs="*", default=[], help="URL MDPI yang diambil langsung")
+    args = parser.parse_args()
+
+    total = 0
+    if args.from_cache:
+        total += save_from_cache(args.from_cache, args.search, args.articles)
+    if args.url:
+        total += save_from_urls(args.url)
+    print(f"[✓] {total} halaman disimpan ke '{REAL_FIXTURES_DIR}'")
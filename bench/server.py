@@ -0,0 +1,148 @@
+"""
+Server HTTP lokal pengganti MDPI yang menyajikan halaman fixture dengan latensi
+yang bisa diatur. Dipakai oleh benchmark, atau jalankan manual:
+
+    python -m bench.server --port 8000 --latency-ms 300 --jitter-ms 100
+"""
+import argparse
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ARTICLE_PATH = re.compile(r"^/bench/article/(\d+)$")
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        fixtures = self.server.fixtures
+        url = urlparse(self.path)
+        match = ARTICLE_PATH.match(url.path)
+
+        if url.path == "/search":
+            page_no = int(parse_qs(url.query).get("page_no", ["1"])[0])
+            body = fixtures.search_pages.get(page_no, fixtures.search_empty)
+        elif match:
+            body = fixtures.articles[int(match.group(1)) % len(fixtures.articles)]
+        else:
+            self.send_error(404)
+            return
+
+        self.server.delay()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record(len(body))
+
+    def log_message(self, format, *args):
+        # Jangan ramaikan output benchmark dengan access log
+        pass
+
+
+class Fixtures:
+    """
+    Halaman fixture yang dimuat ke memori: halaman pencarian per nomor halaman
+    dan halaman artikel (URL artikel ke-n memakai fixture n modulo jumlah fixture).
+    """
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR):
+        self.search_pages = {}
+        self.search_empty = b"<html><body></body></html>"
+        self.articles = []
+        for name in sorted(os.listdir(fixtures_dir)):
+            path = os.path.join(fixtures_dir, name)
+            if not os.path.isfile(path):
+                # Halaman MDPI asli (fixtures/real) hanya untuk benchmark parse
+                continue
+            with open(path, 'rb') as f:
+                content = f.read()
+            search_match = re.match(r"^search_(\d+)\.html$", name)
+            if search_match:
+                self.search_pages[int(search_match.group(1))] = content
+            elif name == "search_empty.html":
+                self.search_empty = content
+            elif name.startswith("article_"):
+                self.articles.append(content)
+
+    @property
+    def article_count(self):
+        """
+        Jumlah artikel unik yang tersedia lewat halaman pencarian.
+        """
+        return sum(page.count(b'class="title-link"') for page in self.search_pages.values())
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    Server fixture dengan latensi `latency_ms` (+/- `jitter_ms`) per request.
+    Mencatat jumlah request dan bytes yang dikirim.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, fixtures_dir=FIXTURES_DIR):
+        super().__init__((host, port), FixtureRequestHandler)
+        self.fixtures = Fixtures(fixtures_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.requests_served = 0
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def delay(self):
+        latency = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def record(self, size):
+        with self._lock:
+            self.requests_served += 1
+            self.bytes_served += size
+
+    def start(self):
+        """
+        Menjalankan server di thread background dan mengembalikan base URL.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server lokal pengganti MDPI untuk benchmark")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    server = FixtureServer(args.host, args.port, args.latency_ms, args.jitter_ms)
+    print(f"[*] Server fixture berjalan di {server.base_url} "
+          f"({len(server.fixtures.search_pages)} halaman pencarian, {len(server.fixtures.articles)} fixture artikel)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,183 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class CrawlState:
+    """
+    Penyimpanan status crawl berbasis SQLite: halaman pencarian yang sudah
+    dikunjungi dan status setiap artikel (pending, done, failed) per `run_key`.
+    Artikel diidentifikasi dengan DOI (atau link jika DOI tidak ada), sehingga
+    artikel yang sama tidak diambil dua kali walaupun crawl diulang.
+    """
+
+    def __init__(self, db_path, run_key):
+        self.db_path = db_path
+        self.run_key = run_key
+        # Dipakai dari thread worker dan thread utama, akses dijaga dengan lock
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                run_key TEXT NOT NULL,
+                page_no INTEGER NOT NULL,
+                article_count INTEGER NOT NULL,
+                visited_at TEXT NOT NULL,
+                PRIMARY KEY (run_key, page_no)
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+                run_key TEXT NOT NULL,
+                article_key TEXT NOT NULL,
+                link TEXT NOT NULL,
+                doi TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                base_data TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (run_key, article_key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_status ON articles (run_key, status);
+            CREATE TABLE IF NOT EXISTS watermarks (
+                run_key TEXT PRIMARY KEY,
+                article_key TEXT NOT NULL,
+                pub_date TEXT,
+                updated_at TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def _now(self):
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def is_page_visited(self, page_no):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM pages WHERE run_key = ? AND page_no = ?",
+                (self.run_key, page_no)
+            ).fetchone()
+        return row is not None
+
+    def mark_page_visited(self, page_no, article_count):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (run_key, page_no, article_count, visited_at) VALUES (?, ?, ?, ?)",
+                (self.run_key, page_no, article_count, self._now())
+            )
+            self.conn.commit()
+
+    def add_pending(self, article_key, link, doi, base_data):
+        """
+        Mendaftarkan artikel sebagai pending. Mengembalikan False jika artikel
+        sudah tercatat (done, failed, atau sedang pending) sehingga tidak perlu
+        diantrikan lagi.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO articles (run_key, article_key, link, doi, status, base_data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.run_key, article_key, link, doi, STATUS_PENDING,
+                 json.dumps(base_data, ensure_ascii=False), self._now())
+            )
+            self.conn.commit()
+        return cursor.rowcount > 0
+
+    def mark_pending(self, article_key):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE articles SET status = ?, updated_at = ? WHERE run_key = ? AND article_key = ?",
+                (STATUS_PENDING, self._now(), self.run_key, article_key)
+            )
+            self.conn.commit()
+
+    def mark_done(self, article_key):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE articles SET status = ?, attempts = attempts + 1, error = NULL, updated_at = ? "
+                "WHERE run_key = ? AND article_key = ?",
+                (STATUS_DONE, self._now(), self.run_key, article_key)
+            )
+            self.conn.commit()
+
+    def mark_failed(self, article_key, error):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE articles SET status = ?, attempts = attempts + 1, error = ?, updated_at = ? "
+                "WHERE run_key = ? AND article_key = ?",
+                (STATUS_FAILED, str(error), self._now(), self.run_key, article_key)
+            )
+            self.conn.commit()
+
+    def retry_candidates(self, max_attempts=3, limit=None):
+        """
+        Frontier artikel yang belum selesai: pending (baru dari fase harvest atau
+        run terhenti sebelum artikel selesai) dan failed yang belum melewati
+        `max_attempts`, sesuai urutan masuk. Mengembalikan list tuple
+        (article_key, base_data), maksimal `limit` item.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT article_key, base_data FROM articles "
+                "WHERE run_key = ? AND (status = ? OR (status = ? AND attempts < ?)) "
+                "ORDER BY rowid LIMIT ?",
+                (self.run_key, STATUS_PENDING, STATUS_FAILED, max_attempts,
+                 -1 if limit is None else limit)
+            ).fetchall()
+        return [(article_key, json.loads(base_data)) for article_key, base_data in rows]
+
+    def count_open(self, max_attempts=3):
+        """
+        Jumlah artikel di frontier yang masih perlu diambil (lihat `retry_candidates`).
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM articles "
+                "WHERE run_key = ? AND (status = ? OR (status = ? AND attempts < ?))",
+                (self.run_key, STATUS_PENDING, STATUS_FAILED, max_attempts)
+            ).fetchone()
+        return row[0]
+
+    def count(self, status=None):
+        with self.lock:
+            if status is None:
+                row = self.conn.execute(
+                    "SELECT COUNT(*) FROM articles WHERE run_key = ?", (self.run_key,)
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    "SELECT COUNT(*) FROM articles WHERE run_key = ? AND status = ?",
+                    (self.run_key, status)
+                ).fetchone()
+        return row[0]
+
+    def get_watermark(self):
+        """
+        High-water mark run sebelumnya: artikel terbaru yang sudah diketahui
+        untuk `run_key` ini. Mengembalikan dict (article_key, pub_date) atau None.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT article_key, pub_date FROM watermarks WHERE run_key = ?", (self.run_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"article_key": row[0], "pub_date": row[1]}
+
+    def set_watermark(self, article_key, pub_date):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO watermarks (run_key, article_key, pub_date, updated_at) VALUES (?, ?, ?, ?)",
+                (self.run_key, article_key, pub_date, self._now())
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,256 @@
+import os
+import shutil
+import tempfile
+import threading
+
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# ChromeDriver yang diletakkan manual di folder project selalu didahulukan
+PROJECT_DRIVER_PATH = os.path.join(PROJECT_DIR, "chromedriver.exe")
+
+# Path ChromeDriver hasil webdriver-manager disimpan agar run berikutnya tidak
+# perlu resolve ulang (yang butuh akses jaringan dan bisa makan beberapa detik)
+DRIVER_PATH_CACHE = os.path.join(PROJECT_DIR, ".chromedriver_path")
+
+# Pesan error WebDriver yang menandakan browser/session sudah mati
+DEAD_SESSION_MARKERS = (
+    "invalid session id",
+    "no such session",
+    "session deleted",
+    "chrome not reachable",
+    "disconnected",
+    "tab crashed",
+    "target window already closed",
+    "target closed",
+)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path(refresh=False):
+    """
+    Path ChromeDriver: chromedriver.exe di folder project, path yang tersimpan
+    dari run sebelumnya, atau hasil `ChromeDriverManager().install()` (lalu
+    disimpan). `refresh=True` mengabaikan path tersimpan, misalnya saat versi
+    Chrome berubah dan driver lama tidak cocok lagi.
+    """
+    global _driver_path
+    if os.path.exists(PROJECT_DRIVER_PATH):
+        return PROJECT_DRIVER_PATH
+
+    with _driver_path_lock:
+        if not refresh:
+            if _driver_path and os.path.exists(_driver_path):
+                return _driver_path
+            if os.path.exists(DRIVER_PATH_CACHE):
+                with open(DRIVER_PATH_CACHE, 'r', encoding='utf-8') as f:
+                    cached = f.read().strip()
+                if cached and os.path.exists(cached):
+                    _driver_path = cached
+                    return _driver_path
+
+        _driver_path = ChromeDriverManager().install()
+        try:
+            with open(DRIVER_PATH_CACHE, 'w', encoding='utf-8') as f:
+                f.write(_driver_path)
+        except OSError as e:
+            print(f"[!] Gagal menyimpan path ChromeDriver: {e}")
+        return _driver_path
+
+
+def is_dead_session(error):
+    """
+    Apakah exception berasal dari browser atau session WebDriver yang mati
+    (bukan sekadar timeout halaman).
+    """
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return True
+    # chromedriver mati: urllib3 gagal menyambung ke port driver
+    if type(error).__name__ in ("MaxRetryError", "NewConnectionError", "ProtocolError"):
+        return True
+    if isinstance(error, WebDriverException):
+        message = (error.msg or str(error)).lower()
+        return any(marker in message for marker in DEAD_SESSION_MARKERS)
+    return False
+
+
+def process_tree_rss_mb(pid):
+    """
+    Total RSS (MB) proses `pid` beserta semua turunannya (chromedriver dan
+    proses Chrome), atau None jika tidak bisa dibaca di platform ini.
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            total = 0
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+    # Tanpa psutil: baca /proc (Linux)
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    rss_kb = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/status", 'r') as f:
+                status = dict(line.split(":", 1) for line in f if ":" in line)
+        except OSError:
+            continue
+        child_pid = int(name)
+        children.setdefault(int(status.get("PPid", "0").strip()), []).append(child_pid)
+        rss_kb[child_pid] = int(status.get("VmRSS", "0 kB").split()[0])
+
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        total_kb += rss_kb.get(current, 0)
+        stack.extend(children.get(current, []))
+    return total_kb / 1024
+
+
+class DriverManager:
+    """
+    Mengelola siklus hidup satu browser Chrome:
+
+    - dimulai saat pertama kali dibutuhkan, dengan profil hasil salinan
+      `profile_template` (cache disk dan cookie dari sesi sebelumnya) jika ada
+    - didaur ulang setiap `recycle_pages` halaman atau saat RSS Chrome melewati
+      `max_rss_mb`, karena memori Chrome terus bertambah selama run panjang
+    - jika browser/session mati, driver dimulai ulang dan halaman yang sedang
+      diproses diulang (maks. `max_restarts` kali berturut-turut)
+
+    `factory(user_data_dir)` membuat driver baru (misalnya `setup_driver`).
+    """
+
+    def __init__(self, factory, recycle_pages=200, max_rss_mb=1500, profile_template=None,
+                 max_restarts=3, name="driver"):
+        self.factory = factory
+        self.recycle_pages = recycle_pages
+        self.max_rss_mb = max_rss_mb
+        self.profile_template = profile_template
+        self.max_restarts = max_restarts
+        self.name = name
+
+        self._driver = None
+        self._profile_dir = None
+        self.pages = 0
+        self.stats = {"starts": 0, "recycles": 0, "restarts": 0, "pages": 0}
+
+    @property
+    def driver(self):
+        """
+        Driver aktif; dimulai jika belum ada. Melempar RuntimeError jika gagal.
+        """
+        if self._driver is None:
+            self._start()
+        return self._driver
+
+    def _start(self):
+        if self.profile_template:
+            self._profile_dir = tempfile.mkdtemp(prefix="mdpi_chrome_")
+            if os.path.isdir(self.profile_template):
+                # Profil yang sedang dipakai tidak bisa dibagi antar instance Chrome
+                shutil.copytree(self.profile_template, self._profile_dir, dirs_exist_ok=True,
+                                ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile"))
+        driver = self.factory(self._profile_dir)
+        if driver is None:
+            self._discard_profile()
+            raise RuntimeError("Driver Selenium tidak tersedia")
+        self._driver = driver
+        self.pages = 0
+        self.stats["starts"] += 1
+
+    def _discard_profile(self, save_as_template=False):
+        if not self._profile_dir:
+            return
+        if save_as_template and self.profile_template and not os.path.isdir(self.profile_template):
+            # Simpan profil pertama yang selesai dipakai sebagai profil hangat
+            try:
+                shutil.copytree(self._profile_dir, self.profile_template,
+                                ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile"))
+                print(f"[*] [{self.name}] Profil Chrome hangat disimpan ke '{self.profile_template}'")
+            except (OSError, shutil.Error) as e:
+                print(f"[!] [{self.name}] Gagal menyimpan profil Chrome: {e}")
+        shutil.rmtree(self._profile_dir, ignore_errors=True)
+        self._profile_dir = None
+
+    def quit(self, save_profile=True):
+        """
+        Menutup browser. Profil disimpan sebagai template jika belum ada.
+        """
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+        self._discard_profile(save_as_template=save_profile)
+
+    def rss_mb(self):
+        """
+        RSS chromedriver dan Chrome (MB), atau None jika tidak diketahui.
+        """
+        if self._driver is None:
+            return None
+        try:
+            pid = self._driver.service.process.pid
+        except AttributeError:
+            return None
+        return process_tree_rss_mb(pid)
+
+    def _maybe_recycle(self):
+        reason = None
+        if self.recycle_pages and self.pages >= self.recycle_pages:
+            reason = f"{self.pages} halaman"
+        elif self.max_rss_mb:
+            rss = self.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                reason = f"RSS {rss:.0f} MB"
+        if reason:
+            print(f"[*] [{self.name}] Daur ulang browser ({reason})")
+            self.quit()
+            self.stats["recycles"] += 1
+
+    def run(self, func, *args, **kwargs):
+        """
+        Menjalankan `func(driver, *args, **kwargs)` untuk satu halaman. Jika
+        session mati, driver dimulai ulang dan `func` diulang.
+        """
+        restarts = 0
+        while True:
+            try:
+                result = func(self.driver, *args, **kwargs)
+            except Exception as e:
+                if not is_dead_session(e) or restarts >= self.max_restarts:
+                    raise
+                restarts += 1
+                self.stats["restarts"] += 1
+                print(f"[!] [{self.name}] Browser mati ({type(e).__name__}), memulai ulang "
+                      f"({restarts}/{self.max_restarts})...")
+                self.quit(save_profile=False)
+                continue
+            self.pages += 1
+            self.stats["pages"] += 1
+            self._maybe_recycle()
+            return result
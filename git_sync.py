@@ -0,0 +1,219 @@
+import os
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+from metrics import METRICS
+
+
+# Git tidak boleh menunggu input credential di thread background
+GIT_ENV = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+
+
+def find_repo_root(path):
+    """
+    Root repository git yang berisi `path`, atau None jika `path` tidak
+    berada di repository git (atau git tidak tersedia).
+    """
+    path = os.path.abspath(path)
+    cwd = path if os.path.isdir(path) else os.path.dirname(path)
+    try:
+        result = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=cwd,
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+class GitSync:
+    """
+    Sinkronisasi output ke remote git di thread background, agar scraping
+    tidak pernah menunggu git.
+
+    Scraper hanya memanggil `submit(paths)`. Path dikumpulkan lalu di-commit
+    sebagai satu batch saat sudah ada `batch_size` artikel atau batch tertua
+    berumur `batch_seconds` detik. Hanya path yang di-submit yang di-stage dan
+    di-commit, perubahan lain di working tree tidak ikut. Push yang gagal
+    diulang dengan backoff eksponensial; commit batch berikutnya ikut terkirim
+    pada push yang sama. `close()` melakukan flush terakhir.
+    """
+
+    def __init__(self, repo_dir, remote="origin", branch="master", batch_size=50, batch_seconds=300,
+                 backoff=5.0, max_backoff=300.0, label="output"):
+        self.repo_dir = repo_dir
+        self.remote = remote
+        self.branch = branch
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.label = label
+
+        self.lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._pending_paths = set()
+        self._pending_articles = 0
+        self._pending_since = None
+        self._unpushed = False
+        self._failures = 0
+        self._retry_at = 0.0
+        self.stats = {"commits": 0, "pushes": 0, "push_failures": 0, "articles": 0}
+
+        self._thread = threading.Thread(target=self._loop, name="git-sync", daemon=True)
+        self._thread.start()
+
+    def submit(self, paths, articles=1):
+        """
+        Mendaftarkan path yang baru atau berubah. Tidak pernah memblokir
+        (selain lock singkat).
+        """
+        with self.lock:
+            self._pending_paths.update(os.path.abspath(path) for path in paths)
+            self._pending_articles += articles
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            if self.batch_size and self._pending_articles >= self.batch_size:
+                self._wake.set()
+
+    def _next_deadline(self):
+        # Waktu (monotonic) tindakan berikutnya: batch jatuh tempo atau retry push
+        deadlines = []
+        if self._pending_since is not None:
+            deadlines.append(max(self._pending_since + self.batch_seconds, self._retry_at))
+        if self._unpushed:
+            deadlines.append(self._retry_at)
+        return min(deadlines) if deadlines else None
+
+    def _loop(self):
+        while True:
+            with self.lock:
+                deadline = self._next_deadline()
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+            with self.lock:
+                stopping = self._stopping
+            self._flush(force=stopping)
+            if stopping:
+                return
+
+    def _take_batch(self, force):
+        with self.lock:
+            if not self._pending_paths:
+                return None, 0
+            now = time.monotonic()
+            due = force or (now >= self._retry_at
+                            and ((self.batch_size and self._pending_articles >= self.batch_size)
+                                 or now - self._pending_since >= self.batch_seconds))
+            if not due:
+                return None, 0
+            paths = sorted(self._pending_paths)
+            articles = self._pending_articles
+            self._pending_paths = set()
+            self._pending_articles = 0
+            self._pending_since = None
+            return paths, articles
+
+    def _restore_batch(self, paths, articles):
+        with self.lock:
+            self._pending_paths.update(paths)
+            self._pending_articles += articles
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+
+    def _git(self, *args):
+        return subprocess.run(["git"] + list(args), cwd=self.repo_dir, check=True, capture_output=True,
+                              env=GIT_ENV)
+
+    def _commit(self, paths, articles):
+        rel_paths = [os.path.relpath(path, self.repo_dir) for path in paths]
+        self._git("add", "--", *rel_paths)
+        # Tidak ada perubahan (misalnya path sudah di-commit sebelumnya)
+        staged = subprocess.run(["git", "diff", "--cached", "--quiet", "--"] + rel_paths, cwd=self.repo_dir)
+        if staged.returncode == 0:
+            return False
+        commit_msg = (f"Add scraped data: {self.label} (+{articles} artikel, "
+                      f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+        # Pathspec membatasi commit ke output scraper saja
+        self._git("commit", "-m", commit_msg, "--", *rel_paths)
+        self.stats["commits"] += 1
+        self.stats["articles"] += articles
+        return True
+
+    def _push(self):
+        self._git("push", self.remote, f"HEAD:{self.branch}")
+        self.stats["pushes"] += 1
+
+    def _flush(self, force=False):
+        paths, articles = self._take_batch(force)
+        if paths:
+            try:
+                with METRICS.timer("git_commit"):
+                    if self._commit(paths, articles):
+                        self._unpushed = True
+                        print(f"[*] Git: {articles} artikel di-commit ({len(paths)} file)")
+            except (subprocess.CalledProcessError, OSError) as e:
+                print(f"[!] Git commit gagal: {_describe(e)}")
+                self._restore_batch(paths, articles)
+                self._schedule_retry()
+                return
+
+        if not self._unpushed or (not force and time.monotonic() < self._retry_at):
+            return
+        retries = 0
+        while True:
+            try:
+                with METRICS.timer("git_push"):
+                    self._push()
+                self._unpushed = False
+                self._failures = 0
+                self._retry_at = 0.0
+                print("[✓] Git push berhasil.")
+                return
+            except (subprocess.CalledProcessError, OSError) as e:
+                self.stats["push_failures"] += 1
+                delay = self._schedule_retry()
+                print(f"[!] Git push gagal ({self._failures}x): {_describe(e)}")
+                if not force or retries >= 3:
+                    # Commit tetap tersimpan lokal dan dikirim pada push berikutnya
+                    if force:
+                        print("[!] Commit lokal belum ter-push; jalankan `git push` secara manual.")
+                    return
+                retries += 1
+                print(f"    └ Mencoba lagi dalam {delay:.0f} detik...")
+                time.sleep(delay)
+
+    def _schedule_retry(self):
+        # Backoff eksponensial; mengembalikan jeda (detik) sampai percobaan berikutnya
+        self._failures += 1
+        delay = min(self.backoff * 2 ** (self._failures - 1), self.max_backoff)
+        with self.lock:
+            self._retry_at = time.monotonic() + delay
+        return delay
+
+    def close(self, timeout=None):
+        """
+        Flush terakhir (commit dan push semua yang tertunda), lalu menghentikan
+        thread. Mengembalikan False jika flush belum selesai dalam `timeout`.
+        """
+        with self.lock:
+            self._stopping = True
+        self._wake.set()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def report(self):
+        print(f"[*] Git sync: {self.stats['commits']} commit ({self.stats['articles']} artikel), "
+              f"{self.stats['pushes']} push, {self.stats['push_failures']} push gagal")
+
+
+def _describe(error):
+    if isinstance(error, subprocess.CalledProcessError):
+        stderr = error.stderr.decode(errors='ignore').strip() if error.stderr else ''
+        return f"{error} {stderr}" if stderr else str(error)
+    return str(error)
@@ -0,0 +1,145 @@
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+class HtmlCache:
+    """
+    Cache HTML mentah di disk, terkompresi gzip dan dialamatkan dengan hash URL.
+    Ukuran total dibatasi `max_bytes` (eviksi LRU berdasarkan waktu akses
+    terakhir) dan setiap entri kedaluwarsa setelah `ttl_seconds`.
+    """
+
+    def __init__(self, cache_dir, max_bytes=2 * 1024 ** 3, ttl_seconds=30 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        # Timeout lebih panjang: cache bisa dipakai bersama beberapa proses worker
+        self.conn = sqlite3.connect(os.path.join(cache_dir, "index.db"), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (last_access);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _path_for(self, key):
+        # Dua karakter pertama hash sebagai subfolder agar satu folder tidak terlalu besar
+        return os.path.join(self.cache_dir, key[:2], key + ".html.gz")
+
+    def get(self, url, ignore_ttl=False):
+        """
+        Mengembalikan HTML untuk `url`, atau None jika tidak ada atau sudah
+        kedaluwarsa. `ignore_ttl=True` dipakai saat re-parse offline.
+        """
+        key = self.key_for(url)
+        with self.lock:
+            row = self.conn.execute("SELECT fetched_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if not ignore_ttl and self.ttl_seconds and time.time() - row[0] > self.ttl_seconds:
+                self._remove(key)
+                self.conn.commit()
+                return None
+            try:
+                with gzip.open(self._path_for(key), 'rt', encoding='utf-8') as f:
+                    html = f.read()
+            except (OSError, EOFError):
+                # File hilang atau rusak, anggap cache miss
+                self._remove(key)
+                self.conn.commit()
+                return None
+            self.conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+        return html
+
+    def put(self, url, html, kind="article"):
+        """
+        Menyimpan HTML untuk `url` lalu melakukan eviksi jika ukuran melebihi batas.
+        """
+        key = self.key_for(url)
+        path = self._path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Tulis ke file sementara lalu rename agar tidak ada entri setengah jadi
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (key, url, kind, size, fetched_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, url, kind, size, now, now)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _remove(self, key):
+        self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            os.remove(self._path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        if not self.max_bytes:
+            return
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def urls(self, kind=None, limit=None):
+        """
+        URL di cache (terbaru lebih dulu), opsional hanya jenis `kind`.
+        """
+        sql = "SELECT url FROM entries"
+        params = []
+        if kind:
+            sql += " WHERE kind = ?"
+            params.append(kind)
+        sql += " ORDER BY fetched_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            return [row[0] for row in self.conn.execute(sql, params).fetchall()]
+
+    def stats(self):
+        """
+        Jumlah entri dan total ukuran (bytes) per jenis halaman.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT kind, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY kind"
+            ).fetchall()
+        return {kind: {"entries": count, "bytes": size} for kind, count, size in rows}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
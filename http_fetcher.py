@@ -0,0 +1,63 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# User agent yang sama dengan yang dipakai Chrome WebDriver
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.7444.176 Safari/537.36"
+
+# Status HTTP dan penanda HTML yang menandakan halaman challenge/anti-bot
+CHALLENGE_STATUS_CODES = (403, 429, 503)
+CHALLENGE_MARKERS = (
+    "challenge-platform",
+    "cf-browser-verification",
+    "cf-chl-",
+    "<title>Just a moment...</title>",
+    "Attention Required! | Cloudflare",
+    "<title>Access Denied</title>",
+)
+
+
+class HttpFetcher:
+    """
+    Client HTTP keep-alive dengan connection pool untuk mengambil halaman
+    detail artikel tanpa membuka browser.
+    """
+
+    def __init__(self, pool_size=10, timeout=20):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
+
+    def fetch(self, url):
+        """
+        Mengambil satu halaman. Mengembalikan tuple (status_code, html).
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        return response.status_code, response.text
+
+    def close(self):
+        self.session.close()
+
+
+def is_bot_challenge(status_code, html):
+    """
+    Mendeteksi apakah respons merupakan halaman challenge/anti-bot.
+    """
+    if status_code in CHALLENGE_STATUS_CODES:
+        return True
+    head = html[:20000]
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+def is_timeout_error(error):
+    """
+    Apakah exception dari `HttpFetcher.fetch` disebabkan oleh timeout.
+    """
+    return isinstance(error, requests.Timeout)
@@ -4,20 +4,50 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import json
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
 import time
+import argparse
 from datetime import datetime
 import os
-import random
-import subprocess
+import re
+import shutil
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+from http_fetcher import HttpFetcher, is_bot_challenge, is_timeout_error, USER_AGENT
+from output_writer import ShardedWriter, compact_jsonl
+from crawl_state import CrawlState, STATUS_DONE, STATUS_FAILED
+from driver_manager import DriverManager, resolve_driver_path
+from git_sync import GitSync, find_repo_root
+from html_cache import HtmlCache
+from metrics import METRICS
+from rate_limiter import AdaptiveRateLimiter
+from search_index import SearchIndex
+from resource_policy import (DEFAULT_RESOURCE_POLICY, NETWORK_USAGE, ResourcePolicy, apply_resource_policy,
+                             collect_page_network, enable_network_logging)
+from parsers import extract_article_content, extract_article_content_timed, parse_search_page, parse_search_item
 
 
-def setup_driver():
+
+# Alamat situs MDPI; bisa diganti ke server lokal untuk benchmark
+MDPI_BASE_URL = "https://www.mdpi.com"
+
+# Halaman pencarian yang gagal dimuat sebanyak ini dianggap akhir hasil pencarian
+SEARCH_PAGE_ATTEMPTS = 3
+
+# Kedalaman field per artikel: "listing" (field halaman pencarian saja),
+# "abstract" (+ abstract dari halaman pencarian), "full" (buka halaman artikel)
+FIELD_DEPTHS = ("listing", "abstract", "full")
+
+def setup_driver(resource_policy=DEFAULT_RESOURCE_POLICY, user_data_dir=None):
     """
     Setup Chrome WebDriver dengan opsi anti-deteksi.
+    Resource yang tidak dibutuhkan (gambar, font, analytics, MathJax, dll.)
+    diblokir lewat CDP sesuai `resource_policy` (None untuk tidak memblokir).
+    `user_data_dir` memakai profil Chrome tertentu (lihat `DriverManager`).
     """
     chrome_options = Options()
     
@@ -31,7 +61,9 @@ def setup_driver():
     # Tambahan opsi anti-deteksi
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-plugins")
-    chrome_options.add_argument("--disable-images")  # Matikan gambar untuk loading lebih cepat
+    if resource_policy is not None and resource_policy.blocks_images:
+        # Matikan gambar untuk loading lebih cepat (--disable-images bukan switch Chrome)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
     # chrome_options.add_argument("--disable-javascript")  # Jangan matikan JS, diperlukan untuk MDPI
     chrome_options.add_argument("--no-first-run")
     chrome_options.add_argument("--disable-default-apps")
@@ -40,33 +72,33 @@ def setup_driver():
     chrome_options.add_argument("--disable-backgrounding-occluded-windows")
     
     # Set user agent yang lebih umum
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.7444.176 Safari/537.36")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
     
     # Opsi tambahan untuk stabilitas
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--start-maximized")
     
+    # Profil Chrome (cache disk dan cookie) yang sudah hangat
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    
+    # Catat event Network untuk menghitung request yang dimuat dan diblokir
+    if resource_policy is not None:
+        enable_network_logging(chrome_options)
+    
     # Uncomment baris berikut jika ingin headless (tanpa GUI)
     chrome_options.add_argument("--headless")  # Disable headless untuk debugging
     
-    # Jika Anda meletakkan chromedriver.exe di folder project,
-    # gunakan path relatif ini untuk membuat Service.
-    chromedriver_path = os.path.join(os.path.dirname(__file__), "chromedriver.exe")
-    service = None
     try:
-        # Jika file ada, buat Service dengan path tersebut
-        if os.path.exists(chromedriver_path):
-            service = Service(chromedriver_path)
-        else:
-            # Gunakan webdriver-manager untuk otomatis download ChromeDriver yang cocok
-            service = Service(ChromeDriverManager().install())
-
-        # Buat webdriver dengan Service (atau tanpa Service jika None)
-        if service:
+        # chromedriver.exe di folder project, path tersimpan, atau webdriver-manager
+        service = Service(resolve_driver_path())
+        try:
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except SessionNotCreatedException:
+            # Driver tersimpan tidak cocok lagi dengan versi Chrome, resolve ulang
+            service = Service(resolve_driver_path(refresh=True))
             driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            driver = webdriver.Chrome(options=chrome_options)
 
         # Hapus flag webdriver pada navigator untuk mengurangi deteksi
         try:
@@ -80,286 +112,786 @@ def setup_driver():
             except Exception:
                 pass
 
+        # Blokir resource yang tidak dibutuhkan
+        if resource_policy is not None:
+            apply_resource_policy(driver, resource_policy)
+
         return driver
     except Exception as e:
         print(f"[!] Error setting up Chrome driver: {e}")
         print("[!] Pastikan ChromeDriver (chromedriver.exe) ada di folder project atau di PATH dan versinya cocok dengan Chrome Anda")
         return None
 
-def get_full_article_content(driver, article_url):
+def make_driver_manager(resource_policy=DEFAULT_RESOURCE_POLICY, name="driver", **settings):
     """
-    Mengambil konten lengkap artikel dari halaman detail MDPI.
+    DriverManager yang membuat driver dengan `setup_driver`. `settings`
+    diteruskan ke DriverManager (recycle_pages, max_rss_mb, profile_template).
+    """
+    return DriverManager(lambda user_data_dir: setup_driver(resource_policy, user_data_dir),
+                         name=name, **settings)
+
+def wait_for_slot(limiter):
+    """
+    Menunggu giliran request dari rate limiter (jika ada).
+    """
+    if limiter is not None:
+        with METRICS.timer("rate_limit_wait"):
+            limiter.acquire()
+
+def wait_until_ready(driver, locators, timeout):
+    """
+    Menunggu document.readyState "complete" lalu salah satu elemen `locators`
+    muncul. Melempar TimeoutException jika tidak terpenuhi dalam `timeout` detik.
+    """
+    wait = WebDriverWait(driver, timeout, poll_frequency=0.2)
+    wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+    wait.until(EC.any_of(*[EC.presence_of_element_located(locator) for locator in locators]))
+
+def record_page_network(driver, kind):
+    """
+    Mencatat request yang dimuat dan yang diblokir untuk halaman yang baru
+    dibuka. Bytes yang dihemat hanya perkiraan (resource yang diblokir tidak
+    pernah diunduh).
     """
+    page_stats = collect_page_network(driver)
+    if page_stats is None:
+        return
+    NETWORK_USAGE.add(kind, page_stats)
+    METRICS.inc("mdpi_blocked_requests_total", page_stats["blocked_requests"], kind=kind)
+    METRICS.inc("mdpi_bytes_total", page_stats["bytes"], direction="network")
+    METRICS.inc("mdpi_bytes_total", page_stats["estimated_bytes_saved"], direction="saved_estimate")
+    if page_stats["blocked_requests"]:
+        print(f"    └ Jaringan: {page_stats['requests']} request ({page_stats['bytes'] / 1024:.0f} KB), "
+              f"{page_stats['blocked_requests']} diblokir (perkiraan hemat {page_stats['estimated_bytes_saved'] / 1024:.0f} KB)")
+
+def report_page_health(limiter, html):
+    """
+    Memberi tahu rate limiter apakah halaman yang dimuat browser sehat atau
+    halaman challenge/anti-bot.
+    """
+    if limiter is None:
+        return
+    if is_bot_challenge(200, html):
+        limiter.on_throttle()
+    else:
+        limiter.on_success()
+
+# Elemen yang menandakan halaman siap di-parse
+SEARCH_READY_LOCATORS = [
+    (By.CLASS_NAME, "generic-item"),
+    (By.CLASS_NAME, "article-item"),
+]
+# Halaman pencarian yang termuat tetapi tanpa hasil (setelah halaman terakhir)
+SEARCH_EMPTY_LOCATORS = [
+    (By.XPATH, "//*[contains(text(), 'No results') or contains(text(), 'did not match any')]"),
+]
+ARTICLE_READY_LOCATORS = [
+    (By.CSS_SELECTOR, "div.html-body"),
+    (By.CSS_SELECTOR, "div.html-abstract"),
+    (By.CSS_SELECTOR, "div.abstract"),
+    (By.CSS_SELECTOR, "div.article-content"),
+    (By.TAG_NAME, "article"),
+]
+
+def load_search_page(driver, search_url, limiter=None):
+    """
+    Membuka halaman hasil pencarian dan menunggu daftar artikel (atau pesan
+    tanpa hasil) dimuat. Tidak ada jeda tetap: laju request diatur oleh `limiter`.
+    Mengembalikan HTML halaman, termasuk halaman tanpa hasil, atau None jika
+    halaman gagal dimuat (timeout atau halaman challenge).
+    """
+    # Navigate ke halaman pencarian
+    wait_for_slot(limiter)
+    with METRICS.timer("search_page_load"):
+        driver.get(search_url)
+    
+    # Tunggu sampai daftar artikel dimuat
     try:
-        # Simpan URL saat ini
-        current_url = driver.current_url
+        # Scroll ke bawah untuk memicu loading konten
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+        with METRICS.timer("search_wait"):
+            wait_until_ready(driver, SEARCH_READY_LOCATORS + SEARCH_EMPTY_LOCATORS, 20)
+        print("    ✓ Halaman berhasil dimuat")
         
-        # Navigate ke halaman artikel
-        driver.get(article_url)
-        time.sleep(3)
+    except Exception as e:
+        print(f"[!] Timeout waiting for articles: {e}")
+        print("    Mencoba dengan strategi alternatif...")
+        if isinstance(e, TimeoutException):
+            METRICS.inc("mdpi_timeouts_total", stage="search_wait")
+        METRICS.inc("mdpi_retries_total", reason="search_refresh")
+        if limiter is not None:
+            limiter.on_error()
         
-        # Tunggu halaman dimuat
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        # Coba refresh halaman (limiter sudah memperlambat laju)
+        wait_for_slot(limiter)
+        driver.refresh()
         
+        # Scroll dan tunggu lagi
+        try:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
+            with METRICS.timer("search_wait"):
+                wait_until_ready(driver, SEARCH_READY_LOCATORS + SEARCH_EMPTY_LOCATORS
+                                 + [(By.TAG_NAME, "article")], 15)
+        except Exception as e2:
+            print(f"    [!] Strategi alternatif gagal: {e2}")
+            if isinstance(e2, TimeoutException):
+                METRICS.inc("mdpi_timeouts_total", stage="search_wait")
+            if limiter is not None:
+                limiter.on_error()
+            return None
+    
+    # Ambil HTML setelah JavaScript dimuat
+    html = driver.page_source
+    report_page_health(limiter, html)
+    record_page_network(driver, "search")
+    if is_bot_challenge(200, html):
+        print("    [!] Halaman challenge/anti-bot, bukan hasil pencarian")
+        return None
+    return html
+
+def output_name(topic, year_from, year_to, journal=None, depth="full"):
+    """
+    Nama folder shard output untuk satu run (tanpa timestamp, agar run
+    berikutnya melanjutkan folder yang sama).
+    """
+    journal_suffix = f"_{journal}" if journal else ""
+    depth_suffix = f"_{depth}" if depth != "full" else ""
+    return f"mdpi_{topic.replace(' ', '_')}_{year_from}-{year_to}{journal_suffix}{depth_suffix}"
+
+def build_search_url(topic, year_from, year_to, page, base_url=MDPI_BASE_URL, journal=None):
+    """
+    Membuat URL pencarian MDPI (urut berdasarkan tanggal terbit, 50 per halaman).
+    `journal` (kode jurnal MDPI, misalnya "entropy") membatasi hasil ke satu jurnal.
+    """
+    return f"{base_url}/search?q={topic.replace(' ', '+')}&year_from={year_from}&year_to={year_to}&sort=pubdate&page_count=50&page_no={page}&featured=&subjects=&journals={journal or ''}&article_types=&countries="
+
+def load_article_page(driver, article_url, limiter=None):
+    """
+    Membuka halaman detail artikel dengan Selenium dan mengembalikan HTML-nya.
+    Menunggu sampai container artikel muncul; jika tidak muncul (halaman memang
+    tidak memilikinya), HTML tetap dikembalikan setelah dokumen selesai dimuat.
+    """
+    # Navigate ke halaman artikel
+    wait_for_slot(limiter)
+    with METRICS.timer("article_page_load"):
+        driver.get(article_url)
+    
+    # Tunggu halaman dimuat
+    try:
+        with METRICS.timer("article_wait"):
+            wait_until_ready(driver, ARTICLE_READY_LOCATORS, 10)
+    except TimeoutException:
+        METRICS.inc("mdpi_timeouts_total", stage="article_wait")
+        if driver.execute_script("return document.readyState") != "complete":
+            if limiter is not None:
+                limiter.on_error()
+            raise
+    
+    html = driver.page_source
+    METRICS.inc("mdpi_bytes_total", len(html), direction="fetched")
+    report_page_health(limiter, html)
+    record_page_network(driver, "article")
+    return html
+
+def get_full_article_content(driver, article_url, cache=None, limiter=None):
+    """
+    Mengambil konten lengkap artikel dari halaman detail MDPI.
+    Driver tidak kembali ke halaman pencarian: link artikel sudah dikumpulkan
+    di fase harvest sehingga halaman pencarian tidak perlu dibuka ulang.
+    Jika `cache` diberikan, HTML mentah halaman disimpan ke cache.
+    Laju request diatur oleh `limiter` (jika ada).
+    """
+    try:
         # Ambil HTML
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        article_content = {}
-        
-        # 1. Ambil Abstract
-        abstract_div = soup.find('div', class_='html-abstract')
-        if not abstract_div:
-            abstract_div = soup.find('div', class_='abstract')
-        if not abstract_div:
-            abstract_div = soup.find('section', {'id': 'abstract'})
-        if not abstract_div:
-            abstract_div = soup.find('div', class_='art-abstract')
-        
-        if abstract_div:
-            abstract_text = abstract_div.get_text(strip=True)
-            if abstract_text.lower().startswith('abstract'):
-                abstract_text = abstract_text[8:].strip()
-            article_content['abstract'] = abstract_text
-        else:
-            article_content['abstract'] = "Abstract not found"
-        
-        # 2. Ambil Keywords
-        keywords_section = soup.find('div', class_='art-keywords')
-        if keywords_section:
-            keywords = keywords_section.get_text(strip=True)
-            if keywords.lower().startswith('keywords'):
-                keywords = keywords[8:].strip()
-            article_content['keywords'] = keywords
-        else:
-            article_content['keywords'] = "Keywords not found"
-        
-        # 3. Ambil konten utama artikel
-        # MDPI biasanya menyimpan konten dalam div dengan class 'html-body' atau 'article-content'
-        main_content_div = soup.find('div', class_='html-body')
-        if not main_content_div:
-            main_content_div = soup.find('div', class_='article-content')
-        if not main_content_div:
-            main_content_div = soup.find('article')
-        
-        if main_content_div:
-            # Ambil semua section dalam artikel
-            sections = {}
-            
-            # Cari section berdasarkan heading (h2, h3)
-            headings = main_content_div.find_all(['h2', 'h3', 'h4'])
-            
-            for i, heading in enumerate(headings):
-                section_title = heading.get_text(strip=True)
-                
-                # Ambil konten antara heading ini dan heading berikutnya
-                content_elements = []
-                next_sibling = heading.next_sibling
-                
-                while next_sibling:
-                    # Stop jika menemukan heading berikutnya
-                    if hasattr(next_sibling, 'name') and next_sibling.name in ['h2', 'h3', 'h4']:
-                        break
-                    
-                    if hasattr(next_sibling, 'get_text'):
-                        text = next_sibling.get_text(strip=True)
-                        if text:  # Skip elemen kosong
-                            content_elements.append(text)
-                    
-                    next_sibling = next_sibling.next_sibling
-                
-                if content_elements:
-                    sections[section_title] = ' '.join(content_elements)
-            
-            # Jika tidak ada heading yang ditemukan, ambil semua teks
-            if not sections:
-                full_text = main_content_div.get_text(strip=True)
-                sections['full_content'] = full_text
-                
-            article_content['sections'] = sections
-        else:
-            article_content['sections'] = {"error": "Main content not found"}
-        
-        # 4. Ambil References (jika ada)
-        references_section = soup.find('div', class_='html-references')
-        if not references_section:
-            references_section = soup.find('section', {'id': 'references'})
-        
-        if references_section:
-            references = []
-            ref_items = references_section.find_all('li') or references_section.find_all('p')
-            for ref in ref_items:
-                ref_text = ref.get_text(strip=True)
-                if ref_text:
-                    references.append(ref_text)
-            article_content['references'] = references
-        else:
-            article_content['references'] = "References not found"
-        
-        # Kembali ke halaman sebelumnya
-        driver.get(current_url)
-        time.sleep(1)
+        html = load_article_page(driver, article_url, limiter)
+        article_content = extract_article_content(html)
+        if cache is not None:
+            store_in_cache(cache, article_url, html)
         
         return article_content
         
     except Exception as e:
         print(f"    [!] Error mengambil konten artikel: {e}")
-        return {
-            "abstract": "Error retrieving content",
-            "keywords": "Error retrieving content", 
-            "sections": {"error": str(e)},
-            "references": "Error retrieving content"
-        }
+        return error_article_content(e)
 
-def git_push_function(file_path):
+def error_article_content(error):
     """
-    Fungsi untuk melakukan git add, commit, dan push.
+    Konten pengganti untuk artikel yang gagal diambil.
+    """
+    return {
+        "abstract": "Error retrieving content",
+        "keywords": "Error retrieving content", 
+        "sections": {"error": str(error)},
+        "references": "Error retrieving content"
+    }
+
+def is_error_content(article_content):
+    """
+    Memeriksa apakah konten (atau data artikel) berasal dari pengambilan yang gagal.
+    """
+    return article_content.get('abstract') == "Error retrieving content"
+
+def has_article_containers(article_content):
+    """
+    Memeriksa apakah hasil ekstraksi memuat container utama (abstract dan body).
+    """
+    return (article_content.get('abstract') != "Abstract not found"
+            and article_content.get('sections') != {"error": "Main content not found"})
+
+def store_in_cache(cache, url, html, kind="article"):
+    """
+    Menyimpan HTML ke cache tanpa menggagalkan proses scraping jika terjadi error.
     """
     try:
-        repo_dir = os.path.dirname(os.path.abspath(__file__))
-        rel_path = os.path.relpath(file_path, repo_dir)
-        print(f"[*] Menambahkan '{rel_path}' ke git dan melakukan push...")
-
-        # git add
-        subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, capture_output=True)
-
-        # git commit
-        commit_msg = f"Add scraped data: {os.path.basename(file_path)} ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})"
-        subprocess.run(["git", "commit", "-m", commit_msg], cwd=repo_dir, check=True, capture_output=True)
-
-        # git push
-        subprocess.run(["git", "push", "origin", "master"], cwd=repo_dir, check=True, capture_output=True)
-
-        print("[✓] Git push berhasil.")
-    except subprocess.CalledProcessError as e:
-        stdout = e.stdout.decode(errors='ignore') if e.stdout else ''
-        stderr = e.stderr.decode(errors='ignore') if e.stderr else ''
-        print(f"[!] Git command failed: {e}.\nSTDOUT:\n{stdout}\nSTDERR:\n{stderr}")
-        print("[!] Periksa konfigurasi remote, credential, atau jalankan git secara manual.")
+        cache.put(url, html, kind=kind)
     except Exception as e:
-        print(f"[!] Error saat menjalankan git: {e}")
+        print(f"    [!] Error menyimpan cache untuk {url}: {e}")
 
-def scrape_mdpi(topic, years_back, limit):
+def fetch_article_html_http(fetcher, article_url, limiter=None):
     """
-    Melakukan scraping jurnal MDPI berdasarkan topik dan rentang tahun.
-    Menggunakan Selenium Chrome WebDriver untuk menghindari deteksi bot.
+    Mengambil HTML halaman detail artikel lewat HTTP tanpa browser.
+    Mengembalikan None jika halaman perlu diambil ulang dengan Selenium
+    (request gagal, challenge terdeteksi, atau status bukan 200).
+    Hasil request dilaporkan ke `limiter` agar laju menyesuaikan.
     """
-    
-    # 1. Konfigurasi Tanggal
-    current_year = datetime.now().year
-    year_from = current_year - years_back
-    year_to = current_year
-    
-    # Timestamp untuk nama file
-    start_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    print(f"[*] Memulai scraping MDPI dengan Selenium...")
-    print(f"[*] Topik: {topic}")
-    print(f"[*] Rentang Tahun: {year_from} - {year_to}")
-    print(f"[*] Target Jumlah: {limit} artikel")
-    print(f"[*] Timestamp: {start_timestamp}")
-    print("-" * 50)
+    wait_for_slot(limiter)
+    try:
+        with METRICS.timer("http_fetch"):
+            status_code, html = fetcher.fetch(article_url)
+    except Exception as e:
+        print(f"    [!] HTTP gagal untuk {article_url}: {e}")
+        if is_timeout_error(e):
+            METRICS.inc("mdpi_timeouts_total", stage="http_fetch")
+        if limiter is not None:
+            limiter.on_error()
+        return None
+    METRICS.inc("mdpi_bytes_total", len(html), direction="fetched")
 
-    # Setup WebDriver
-    driver = setup_driver()
-    if not driver:
-        return
-    
-    articles_data = []
-    
-    # Setup untuk live saving
-    output_dir = "output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"[*] Folder '{output_dir}' berhasil dibuat.")
-    
-    filename = f"mdpi_{topic.replace(' ', '_')}_{year_from}-{year_to}_{start_timestamp}.json"
-    filepath = os.path.join(output_dir, filename)
-    
-    # Buat file JSON kosong atau baca yang sudah ada
-    if os.path.exists(filepath):
+    if is_bot_challenge(status_code, html):
+        print(f"    [!] Challenge terdeteksi (HTTP {status_code}), fallback ke Selenium")
+        if limiter is not None:
+            limiter.on_throttle()
+        return None
+    if status_code != 200:
+        print(f"    [!] HTTP {status_code} untuk {article_url}, fallback ke Selenium")
+        if limiter is not None and status_code >= 500:
+            limiter.on_error()
+        return None
+    if limiter is not None:
+        limiter.on_success()
+    return html
+
+DOI_PATTERN = re.compile(r"10\.\d{4,9}/[^\s;()]+")
+
+def extract_doi(text):
+    """
+    Mengambil DOI dari teks info jurnal, misalnya 'https://doi.org/10.3390/e27121233'.
+    """
+    match = DOI_PATTERN.search(text or "")
+    return match.group(0).rstrip('.') if match else None
+
+PUB_DATE_PATTERN = re.compile(r"(\d{1,2} [A-Z][a-z]{2} \d{4})\s*$")
+
+def extract_pub_date(text):
+    """
+    Mengambil tanggal terbit dari akhir teks info jurnal (misalnya '... - 5 Dec 2025')
+    dalam format ISO '2025-12-05', atau None jika tidak ditemukan.
+    """
+    match = PUB_DATE_PATTERN.search(text or "")
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%d %b %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+def article_key_for(article_data):
+    """
+    Kunci unik artikel untuk deduplikasi: DOI jika ada, selain itu link.
+    """
+    return extract_doi(article_data.get("journal")) or article_data["link"]
+
+def build_listing_data(base_data, depth):
+    """
+    Data artikel untuk depth "listing" atau "abstract": hanya field yang ada di
+    halaman pencarian, tanpa membuka halaman artikel.
+    """
+    article_data = {
+        "title": base_data["title"],
+        "authors": base_data["authors"],
+        "journal": base_data["journal"],
+    }
+    if depth == "abstract":
+        article_data["abstract"] = base_data.get("abstract", "Abstract not found")
+    article_data["link"] = base_data["link"]
+    article_data["depth"] = depth
+    article_data["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return article_data
+
+def build_article_data(base_data, article_content):
+    """
+    Menggabungkan data dari halaman pencarian dengan konten lengkap artikel.
+    """
+    return {
+        "title": base_data["title"],
+        "authors": base_data["authors"],
+        "journal": base_data["journal"],
+        "abstract": article_content.get('abstract', 'Abstract not found'),
+        "keywords": article_content.get('keywords', 'Keywords not found'),
+        "full_content": article_content.get('sections', {}),
+        "references": article_content.get('references', 'References not found'),
+        "link": base_data["link"],
+        "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+class ArticlePipeline:
+    """
+    Pipeline pengambilan artikel yang terdiri dari tiga tahap dengan antrian
+    terbatas di antaranya:
+
+    1. fetch  - `num_workers` thread mengambil HTML (cache, HTTP, atau Selenium)
+    2. parse  - HTML diekstrak di `ProcessPoolExecutor` dengan `parse_workers` proses
+    3. write  - satu thread meneruskan hasil ke `on_result` sesuai urutan submit
+
+    Antrian yang penuh menahan tahap sebelumnya (backpressure), sehingga driver
+    pencarian tidak berlari terlalu jauh di depan. Error atau crash saat parse
+    hanya menggagalkan artikel yang bersangkutan.
+
+    Dengan `fetch_mode="http"` halaman diambil lewat client HTTP keep-alive dan
+    driver Selenium hanya dibuka saat dibutuhkan sebagai fallback (termasuk jika
+    hasil parse tidak memuat container utama). Dengan `fetch_mode="selenium"`
+    setiap worker langsung memakai driver headless. Jika `cache` diberikan,
+    halaman yang masih ada di cache tidak diambil ulang. Semua request jaringan
+    melewati `limiter` (AdaptiveRateLimiter) yang dipakai bersama.
+    """
+
+    # Batas parse ulang artikel yang terkena crash proses parser
+    MAX_PARSE_ATTEMPTS = 2
+
+    def __init__(self, num_workers, on_result, parse_workers=None, queue_size=None,
+                 fetch_mode="http", cache=None, limiter=None, resource_policy=DEFAULT_RESOURCE_POLICY,
+                 driver_settings=None):
+        self.on_result = on_result
+        self.cache = cache
+        self.limiter = limiter
+        self.resource_policy = resource_policy
+        self.driver_settings = driver_settings or {}
+        self.driver_managers = []
+        self.fetch_mode = fetch_mode
+        queue_size = queue_size or num_workers * 2
+
+        # Antrian antar tahap
+        self.tasks = queue.Queue(maxsize=queue_size)
+        self.fallback_tasks = queue.Queue()  # Artikel yang perlu diambil ulang dengan Selenium
+        self.parse_queue = queue.Queue(maxsize=queue_size)
+        self.parse_retry = queue.Queue()  # Artikel yang perlu di-parse ulang setelah crash proses
+        self.write_queue = queue.Queue()
+        self.pending = {}
+        self.received = 0
+
+        self.submitted = 0
+        self.stats = []
+        self.fetch_threads = []
+        self.started_at = time.time()
+        self.fetcher = HttpFetcher(pool_size=num_workers) if fetch_mode == "http" else None
+        self.parse_stats = {"articles": 0, "errors": 0, "crashes": 0, "parse_seconds": 0.0}
+        self.max_depths = {"fetch": 0, "parse": 0, "write": 0, "reorder": 0}
+
+        # Tahap parse: process pool (atau inline jika parse_workers == 0)
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+        self.parse_workers = parse_workers
+        self.executor = self._new_executor()
+        self.isolated_executor = None  # Satu proses untuk parse ulang artikel korban crash
+        self.in_flight = threading.BoundedSemaphore(max(self.parse_workers, 1) * 2)
+
+        for worker_id in range(1, num_workers + 1):
+            # Driver mode HTTP baru dibuka saat pertama kali dibutuhkan sebagai fallback
+            driver_manager = make_driver_manager(resource_policy, name=f"worker-{worker_id}",
+                                                 **self.driver_settings)
+            if not self.fetcher:
+                try:
+                    driver_manager.driver
+                except RuntimeError:
+                    print(f"[!] Worker {worker_id} gagal memulai driver, dilewati.")
+                    continue
+            stats = {"worker": worker_id, "articles": 0, "errors": 0, "busy_seconds": 0.0,
+                     "http": 0, "selenium": 0, "cache": 0}
+            self.driver_managers.append(driver_manager)
+            thread = threading.Thread(
+                target=self._fetch_loop,
+                args=(driver_manager, stats),
+                name=f"article-fetch-{worker_id}",
+                daemon=True
+            )
+            self.stats.append(stats)
+            self.fetch_threads.append(thread)
+            thread.start()
+
+        self.parse_thread = threading.Thread(target=self._parse_loop, name="article-parse", daemon=True)
+        self.write_thread = threading.Thread(target=self._write_loop, name="article-write", daemon=True)
+        self.parse_thread.start()
+        self.write_thread.start()
+
+        print(f"[*] Pipeline aktif: {len(self.fetch_threads)} fetch worker (mode: {fetch_mode}), "
+              f"{self.parse_workers} proses parser")
+
+    def __len__(self):
+        return len(self.fetch_threads)
+
+    def _new_executor(self, max_workers=None):
+        if not self.parse_workers:
+            return None
+        # "spawn" agar proses parser tidak mewarisi state thread/driver dari proses utama
+        return ProcessPoolExecutor(max_workers=max_workers or self.parse_workers,
+                                   mp_context=multiprocessing.get_context("spawn"))
+
+    def submit(self, link, base_data):
+        """
+        Memasukkan satu URL detail artikel ke antrian (blocking jika antrian penuh).
+        """
+        index = self.submitted
+        self.submitted += 1
+        self.tasks.put((index, link, base_data))
+        self._record_depths()
+
+    def queue_depths(self):
+        """
+        Kedalaman antrian setiap tahap saat ini.
+        """
+        return {
+            "fetch": self.tasks.qsize() + self.fallback_tasks.qsize(),
+            "parse": self.parse_queue.qsize(),
+            "write": self.write_queue.qsize(),
+            "reorder": len(self.pending),
+        }
+
+    def _record_depths(self):
+        for stage, depth in self.queue_depths().items():
+            if depth > self.max_depths[stage]:
+                self.max_depths[stage] = depth
+
+    # --- Tahap 1: fetch ---
+
+    def _fetch_loop(self, driver_manager, stats):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                articles_data = json.load(f)
-            print(f"[*] Melanjutkan dari {len(articles_data)} artikel yang sudah ada")
-        except:
-            articles_data = []
-    
+            while True:
+                # Artikel fallback didahulukan agar urutan output tidak tertahan lama
+                try:
+                    task = self.fallback_tasks.get_nowait()
+                    force_selenium = True
+                except queue.Empty:
+                    try:
+                        task = self.tasks.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    force_selenium = False
+                if task is None:
+                    break
+
+                index, link, base_data = task
+                started = time.time()
+                html, source = None, None
+                try:
+                    if not force_selenium:
+                        html = self.cache.get(link) if self.cache else None
+                        if html is not None:
+                            source = "cache"
+                        elif self.fetcher:
+                            html = fetch_article_html_http(self.fetcher, link, self.limiter)
+                            if html is not None:
+                                source = "http"
+
+                    if html is None:
+                        # Fallback ke Selenium; browser yang mati dimulai ulang
+                        # dan artikel ini diulang oleh driver manager
+                        html = driver_manager.run(load_article_page, link, self.limiter)
+                        source = "selenium"
+                    stats[source] += 1
+                    METRICS.inc("mdpi_pages_total", kind="article", source=source)
+                except Exception as e:
+                    print(f"    [!] Error mengambil konten artikel: {e}")
+                    stats["errors"] += 1
+                    self.write_queue.put((index, build_article_data(base_data, error_article_content(e))))
+                else:
+                    self.parse_queue.put((index, link, base_data, html, source, 1))
+                stats["busy_seconds"] += time.time() - started
+                stats["articles"] += 1
+                self._record_depths()
+        finally:
+            driver_manager.quit()
+
+    # --- Tahap 2: parse ---
+
+    def _parse_loop(self):
+        while True:
+            # Artikel yang terkena crash proses parser didahulukan
+            try:
+                job = self.parse_retry.get_nowait()
+            except queue.Empty:
+                try:
+                    job = self.parse_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+            if job is None:
+                break
+
+            # Batasi jumlah job yang sedang diproses agar antrian parse menahan fetch
+            self.in_flight.acquire()
+            if self.executor is None:
+                try:
+                    result = extract_article_content_timed(job[3])
+                except Exception as e:
+                    self._handle_parse_error(job, e)
+                else:
+                    self._handle_parse_result(job, result)
+                continue
+
+            if job[5] > 1:
+                self._parse_isolated(job)
+                continue
+
+            try:
+                future = self.executor.submit(extract_article_content_timed, job[3])
+            except BrokenProcessPool:
+                # Proses parser mati, buat executor baru lalu coba lagi
+                self.executor.shutdown(wait=False)
+                self.executor = self._new_executor()
+                future = self.executor.submit(extract_article_content_timed, job[3])
+            future.add_done_callback(lambda f, job=job: self._on_parse_done(job, f))
+
+    def _parse_isolated(self, job):
+        # Crash pool menggagalkan semua job yang sedang berjalan. Korban di-parse
+        # ulang satu per satu di proses sendiri, jadi crash di sini pasti
+        # berasal dari halaman ini dan hanya artikel ini yang gagal.
+        if self.isolated_executor is None:
+            self.isolated_executor = self._new_executor(max_workers=1)
+        try:
+            result = self.isolated_executor.submit(extract_article_content_timed, job[3]).result()
+        except BrokenProcessPool as e:
+            self.parse_stats["crashes"] += 1
+            self.isolated_executor.shutdown(wait=False)
+            self.isolated_executor = None
+            self._handle_parse_error(job, e)
+        except Exception as e:
+            self._handle_parse_error(job, e)
+        else:
+            self._handle_parse_result(job, result)
+
+    def _on_parse_done(self, job, future):
+        try:
+            result = future.result()
+        except BrokenProcessPool as e:
+            self.parse_stats["crashes"] += 1
+            index, link, base_data, html, source, attempt = job
+            if attempt < self.MAX_PARSE_ATTEMPTS:
+                # Parse ulang terisolasi: artikel lain yang ikut terkena crash tidak hilang
+                METRICS.inc("mdpi_retries_total", reason="parse_crash")
+                self.in_flight.release()
+                self.parse_retry.put((index, link, base_data, html, source, attempt + 1))
+                return
+            self._handle_parse_error(job, e)
+        except Exception as e:
+            self._handle_parse_error(job, e)
+        else:
+            self._handle_parse_result(job, result)
+
+    def _handle_parse_error(self, job, error):
+        index, link, base_data = job[:3]
+        print(f"    [!] Error parse artikel {link}: {error}")
+        self.parse_stats["errors"] += 1
+        self.in_flight.release()
+        self.write_queue.put((index, build_article_data(base_data, error_article_content(error))))
+
+    def _handle_parse_result(self, job, result):
+        index, link, base_data, html, source, _ = job
+        article_content, parse_seconds = result
+        self.parse_stats["articles"] += 1
+        self.parse_stats["parse_seconds"] += parse_seconds
+        METRICS.observe("parse", parse_seconds)
+        self.in_flight.release()
+
+        if source == "http" and not has_article_containers(article_content):
+            print("    [!] Container artikel tidak lengkap, fallback ke Selenium")
+            METRICS.inc("mdpi_retries_total", reason="selenium_fallback")
+            self.fallback_tasks.put((index, link, base_data))
+            return
+
+        if self.cache is not None and source != "cache":
+            store_in_cache(self.cache, link, html)
+        self.write_queue.put((index, build_article_data(base_data, article_content)))
+
+    # --- Tahap 3: write ---
+
+    def _write_loop(self):
+        # Simpan hasil yang datang lebih awal sampai semua index sebelumnya selesai
+        next_index = 0
+        while True:
+            item = self.write_queue.get()
+            if item is None:
+                break
+
+            index, article_data = item
+            self.received += 1
+            self.pending[index] = article_data
+            self._record_depths()
+            while next_index in self.pending:
+                data = self.pending.pop(next_index)
+                next_index += 1
+                try:
+                    self.on_result(data)
+                except Exception as e:
+                    print(f"    [!] Error memproses hasil artikel: {e}")
+
+                if next_index % 25 == 0:
+                    depths = self.queue_depths()
+                    print(f"[*] Antrian: fetch {depths['fetch']}, parse {depths['parse']}, "
+                          f"write {depths['write']}, menunggu urutan {depths['reorder']}")
+
+    def close(self):
+        """
+        Menunggu semua antrian selesai diproses lalu menutup driver dan proses parser.
+        """
+        # Tunggu semua artikel yang sudah disubmit sampai ke tahap write; artikel
+        # fallback bisa kembali ke tahap fetch, jadi worker belum boleh dihentikan
+        while self.received < self.submitted:
+            if not any(thread.is_alive() for thread in self.fetch_threads):
+                break
+            time.sleep(0.2)
+
+        for _ in self.fetch_threads:
+            self.tasks.put(None)
+        for thread in self.fetch_threads:
+            thread.join()
+
+        self.parse_queue.put(None)
+        self.parse_thread.join()
+        for executor in (self.executor, self.isolated_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self.write_queue.put(None)
+        self.write_thread.join()
+        if self.fetcher:
+            self.fetcher.close()
+
+    def report(self):
+        """
+        Menampilkan throughput per worker fetch, statistik parse, dan kedalaman
+        antrian maksimum setiap tahap.
+        """
+        elapsed = max(time.time() - self.started_at, 1e-9)
+        print("[*] Throughput worker:")
+        for stats in self.stats:
+            per_article = stats["busy_seconds"] / stats["articles"] if stats["articles"] else 0.0
+            per_minute = stats["articles"] / elapsed * 60
+            print(f"    Worker {stats['worker']}: {stats['articles']} artikel, {stats['errors']} error, "
+                  f"{per_minute:.1f} artikel/menit, rata-rata {per_article:.1f} detik/artikel "
+                  f"(cache: {stats['cache']}, HTTP: {stats['http']}, Selenium: {stats['selenium']})")
+        total = sum(stats["articles"] for stats in self.stats)
+        print(f"    Total: {total} artikel dalam {elapsed:.0f} detik ({total / elapsed * 60:.1f} artikel/menit)")
+        print(f"    Jalur pengambilan: cache {sum(stats['cache'] for stats in self.stats)}, "
+              f"HTTP {sum(stats['http'] for stats in self.stats)}, "
+              f"Selenium {sum(stats['selenium'] for stats in self.stats)}")
+        parsed = self.parse_stats["articles"]
+        per_parse = self.parse_stats["parse_seconds"] / parsed * 1000 if parsed else 0.0
+        print(f"    Parse: {parsed} halaman, rata-rata {per_parse:.1f} ms/halaman, "
+              f"{self.parse_stats['errors']} error, {self.parse_stats['crashes']} crash proses")
+        print(f"    Antrian maksimum: fetch {self.max_depths['fetch']}, parse {self.max_depths['parse']}, "
+              f"write {self.max_depths['write']}, menunggu urutan {self.max_depths['reorder']}")
+        browser = {key: sum(manager.stats[key] for manager in self.driver_managers)
+                   for key in ("starts", "recycles", "restarts")}
+        if browser["starts"]:
+            print(f"    Browser: {browser['starts']} kali dimulai, {browser['recycles']} daur ulang, "
+                  f"{browser['restarts']} restart setelah crash")
+
+def write_metrics_report(filepath, metrics_file=None):
+    """
+    Menyimpan ringkasan metrik ke `<output>_metrics.json` (dan file Prometheus
+    jika `metrics_file` diberikan), lalu menampilkan durasi setiap tahap.
+    """
+    summary_path = os.path.splitext(filepath)[0] + "_metrics.json"
+    try:
+        METRICS.write_summary(summary_path)
+        if metrics_file:
+            METRICS.write_prometheus(metrics_file)
+    except OSError as e:
+        print(f"[!] Error menyimpan metrik: {e}")
+        return
+
+    print("[*] Durasi per tahap:")
+    for stage, stats in METRICS.summary()["stages"].items():
+        print(f"    {stage}: {stats['count']}x, total {stats['total_seconds']:.1f} detik, "
+              f"rata-rata {stats['mean_seconds'] * 1000:.1f} ms, maks {stats['max_seconds'] * 1000:.1f} ms")
+    print(f"[✓] Ringkasan metrik disimpan ke '{summary_path}'")
+
+def harvest_links(driver_manager, state, topic, year_from, year_to, limit, max_attempts=3, cache=None,
+                  limiter=None, base_url=MDPI_BASE_URL, incremental=False, journal=None, with_abstract=False,
+                  abort=None):
+    """
+    Fase 1 (harvest): mendaftarkan artikel dari halaman pencarian ke frontier
+    di crawl state sampai `limit` atau hasil pencarian habis. Dengan
+    `incremental=True` hanya artikel yang terbit sejak run sebelumnya.
+    Mengembalikan jumlah artikel baru yang ditambahkan ke frontier.
+    """
+    # Mode incremental: `limit` membatasi artikel baru per run, bukan total
+    known = (0 if incremental else state.count(STATUS_DONE)) + state.count_open(max_attempts)
+    added = 0
     page = 1
-    articles_count_for_push = len(articles_data)  # Counter untuk auto-push
-    
+    watermark = state.get_watermark() if incremental else None
+    newest = None  # Artikel pertama di halaman 1, calon high-water mark baru
+    reached_known = False
+    exhausted = False
+    failed = False
+    page_failures = 0
+    if incremental:
+        if watermark:
+            print(f"[*] Mode incremental: berhenti di {watermark['article_key']} "
+                  f"(terbit {watermark['pub_date'] or 'tanggal tidak diketahui'})")
+        else:
+            print("[*] Mode incremental: belum ada high-water mark, menelusuri semua halaman")
+
     try:
-        while len(articles_data) < limit:
+        while known < limit and not reached_known:
+            if abort is not None and abort.is_set():
+                break
+            # Lewati halaman pencarian yang sudah selesai dikunjungi (nomor
+            # halaman bergeser saat ada artikel baru, jadi tidak di mode incremental)
+            if not incremental and state.is_page_visited(page):
+                print(f"[*] Halaman {page} sudah dikunjungi, dilewati")
+                page += 1
+                continue
+
             # Buat URL pencarian dengan parameter
-            search_url = f"https://www.mdpi.com/search?q={topic.replace(' ', '+')}&year_from={year_from}&year_to={year_to}&sort=pubdate&page_count=50&page_no={page}&featured=&subjects=&journals=&article_types=&countries="
+            search_url = build_search_url(topic, year_from, year_to, page, base_url, journal)
             
             print(f"[*] Mengakses halaman {page}...")
             print(f"    URL: {search_url}")
             
-            # Navigate ke halaman pencarian
-            driver.get(search_url)
-            
-            # Tunggu halaman dimuat dengan lebih sabar
-            time.sleep(random.uniform(5, 8))
-            
-            # Tunggu sampai halaman sepenuhnya dimuat
-            try:
-                # Tunggu sampai body dimuat dulu
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                
-                # Scroll ke bawah untuk memicu loading konten
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-                time.sleep(2)
-                
-                # Tunggu artikel dimuat
-                WebDriverWait(driver, 20).until(
-                    EC.any_of(
-                        EC.presence_of_element_located((By.CLASS_NAME, "generic-item")),
-                        EC.presence_of_element_located((By.CLASS_NAME, "article-item")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".generic-item.article-item"))
-                    )
-                )
-                print("    ✓ Halaman berhasil dimuat")
-                
-            except Exception as e:
-                print(f"[!] Timeout waiting for articles: {e}")
-                print("    Mencoba dengan strategi alternatif...")
-                
-                # Coba refresh halaman
-                time.sleep(5)
-                driver.refresh()
-                time.sleep(random.uniform(5, 10))
-                
-                # Scroll dan tunggu lagi
-                try:
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
-                    time.sleep(3)
-                    WebDriverWait(driver, 15).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "article"))
-                    )
-                except Exception as e2:
-                    print(f"    [!] Strategi alternatif gagal: {e2}")
-                    print("    Melanjutkan ke halaman berikutnya...")
-                    continue
-            
-            # Ambil HTML setelah JavaScript dimuat
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            # Ambil dari cache jika masih segar, selain itu buka dengan browser.
+            # Mode incremental selalu memuat ulang karena halaman 1 berubah.
+            html = cache.get(search_url) if cache and not incremental else None
+            from_cache = html is not None
+            if from_cache:
+                print("    ✓ Halaman diambil dari cache")
+            else:
+                html = driver_manager.run(load_search_page, search_url, limiter)
+                if html is None:
+                    # Timeout atau challenge, bukan akhir hasil (halaman tanpa hasil tetap dikembalikan)
+                    page_failures += 1
+                    if page_failures < SEARCH_PAGE_ATTEMPTS:
+                        print(f"    Mencoba lagi halaman {page} ({page_failures}/{SEARCH_PAGE_ATTEMPTS})...")
+                        continue
+                    print(f"[!] Halaman {page} gagal dimuat {page_failures}x, penelusuran dihentikan "
+                          f"(dilanjutkan pada run berikutnya)")
+                    failed = True
+                    break
+                page_failures = 0
+                METRICS.inc("mdpi_bytes_total", len(html), direction="fetched")
+            METRICS.inc("mdpi_pages_total", kind="search", source="cache" if from_cache else "selenium")
             
             # Mencari artikel berdasarkan berbagai kemungkinan struktur
-            article_items = soup.find_all('div', class_='generic-item article-item')
-            
-            # Jika tidak ditemukan, coba alternatif lain
-            if not article_items:
-                article_items = soup.find_all('div', class_='generic-item')
-                article_items = [item for item in article_items if 'article-item' in item.get('class', [])]
-            
-            if not article_items:
-                article_items = soup.find_all('article')
+            with METRICS.timer("search_parse"):
+                soup, article_items = parse_search_page(html)
             
             if not article_items:
                 print("[!] Tidak ada artikel ditemukan di halaman ini.")
@@ -374,101 +906,499 @@ def scrape_mdpi(topic, years_back, limit):
                 
                 if page == 1:
                     print("    [!] Halaman pertama tidak berhasil, kemungkinkan ada masalah dengan akses MDPI")
+                exhausted = page > 1
                 break
                 
             print(f"[*] Ditemukan {len(article_items)} artikel di halaman {page}")
+            if cache and not from_cache:
+                store_in_cache(cache, search_url, html, kind="search")
             
+            page_complete = True
+            page_added = 0
             for item in article_items:
-                if len(articles_data) >= limit:
+                if known >= limit:
+                    page_complete = False
                     break
                     
                 try:
-                    # Ambil title dan link
-                    title_link = item.find('a', class_='title-link')
-                    if not title_link:
+                    base_data = parse_search_item(item, base_url, with_abstract)
+                    if not base_data:
                         continue
-                        
-                    title = title_link.get_text(strip=True)
-                    link = "https://www.mdpi.com" + title_link.get('href', '')
-                    
-                    # Ambil authors
-                    authors_div = item.find('div', class_='authors')
-                    authors = authors_div.get_text(strip=True) if authors_div else "No Authors"
+                    article_key = article_key_for(base_data)
+                    pub_date = extract_pub_date(base_data["journal"])
+                    if newest is None:
+                        newest = (article_key, pub_date)
                     
-                    # Ambil journal info
-                    journal_div = item.find('div', class_='color-grey-dark')
-                    journal_info = journal_div.get_text(strip=True) if journal_div else "Unknown Journal"
-                    
-                    # Ambil konten lengkap dari halaman detail artikel
-                    print(f"    └ Mengambil konten lengkap untuk: {title[:40]}...")
-                    article_content = get_full_article_content(driver, link)
-                    
-                    article_data = {
-                        "title": title,
-                        "authors": authors,
-                        "journal": journal_info,
-                        "abstract": article_content.get('abstract', 'Abstract not found'),
-                        "keywords": article_content.get('keywords', 'Keywords not found'),
-                        "full_content": article_content.get('sections', {}),
-                        "references": article_content.get('references', 'References not found'),
-                        "link": link,
-                        "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                    
-                    articles_data.append(article_data)
-                    
-                    # Live insert: Simpan ke JSON setiap artikel berhasil diambil
-                    try:
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            json.dump(articles_data, f, ensure_ascii=False, indent=4)
-                        print(f"    ✓ [{len(articles_data)}] {title[:60]}... (Tersimpan)")
-                    except Exception as e:
-                        print(f"    ✓ [{len(articles_data)}] {title[:60]}... (Error saving: {e})")
+                    # Mode incremental: hasil urut tanggal terbit, jadi artikel
+                    # high-water mark (atau yang terbit sebelum tanggalnya) dan
+                    # semua setelahnya sudah diambil di run sebelumnya
+                    if watermark and (article_key == watermark["article_key"]
+                                      or (pub_date and watermark["pub_date"] and pub_date < watermark["pub_date"])):
+                        print("    └ Mencapai artikel yang sudah diketahui, penelusuran dihentikan")
+                        reached_known = True
+                        page_complete = False
+                        break
                     
-                    # Auto-push setiap 50 artikel
-                    articles_count_for_push += 1
-                    if articles_count_for_push % 50 == 0:
-                        print(f"\n[*] Mencapai {articles_count_for_push} artikel - Melakukan auto-push...")
-                        try:
-                            git_push_function(filepath)
-                        except Exception as e:
-                            print(f"[!] Error saat auto-push: {e}")
-                        print()
+                    # Lewati artikel yang sudah tercatat di crawl state
+                    if state.add_pending(article_key, base_data["link"],
+                                         extract_doi(base_data["journal"]), base_data):
+                        known += 1
+                        page_added += 1
                     
                 except Exception as e:
                     print(f"    [!] Error parsing artikel: {e}")
                     continue
             
+            print(f"    └ {page_added} link baru masuk frontier")
+            added += page_added
+            if page_complete and not incremental:
+                state.mark_page_visited(page, len(article_items))
             page += 1
+                
+    except Exception as e:
+        print(f"[!] Error umum: {e}")
+        return added
+
+    # High-water mark dimajukan ke artikel terbaru hanya jika tidak ada celah
+    # dengan run sebelumnya: penelusuran mencapai artikel yang sudah diketahui,
+    # hasil pencarian habis, atau ini run incremental pertama. Jika berhenti
+    # karena `limit` atau halaman gagal dimuat, run berikutnya mengulang dari
+    # halaman 1 sampai celahnya tertutup.
+    if (incremental and newest is not None and not failed
+            and (reached_known or exhausted or watermark is None)):
+        state.set_watermark(*newest)
+        print(f"[*] High-water mark diperbarui: {newest[0]} (terbit {newest[1] or 'tanggal tidak diketahui'})")
+    return added
+
+# Pengaturan default `scrape_mdpi` per kelompok; argumen `*_config` cukup
+# berisi key yang ingin diubah. Path relatif (profil, cache, indeks) berada di
+# dalam `output_dir`.
+DRIVER_CONFIG = {
+    "resource_policy": DEFAULT_RESOURCE_POLICY,   # resource yang diblokir di browser (resource_policy.py)
+    "recycle_pages": 200,                         # restart browser setiap N halaman (0 = tidak pernah)
+    "max_rss_mb": 1500,                           # ...atau saat memori Chrome melewati batas ini
+    "profile_template": "chrome_profile",         # profil Chrome hangat (None untuk profil baru)
+}
+OUTPUT_CONFIG = {
+    "output_dir": "output",
+    "shard_size": 500,                   # jumlah artikel per shard .jsonl.gz
+    "fsync_every": 10,                   # fsync shard setiap N artikel
+    "compact_output": True,              # buat JSON array dari shard setelah run selesai
+    "search_index": "search_index.db",   # indeks FTS5 di output_dir (None untuk menonaktifkan)
+    "cache_dir": "html_cache",           # cache HTML untuk reparse_from_cache (None untuk menonaktifkan)
+    "cache_max_gb": 2,
+    "cache_ttl_days": 30,
+}
+SYNC_CONFIG = {
+    "auto_push": True,       # commit & push shard di background jika output ada di repository git
+    "push_every": 50,        # ...setiap N artikel
+    "push_interval": 300,    # ...atau setiap N detik
+    "git_remote": "origin",
+    "git_branch": "master",
+}
+METRICS_CONFIG = {
+    "enabled": True,
+    "file": None,    # file metrik Prometheus yang ditulis berkala
+    "port": None,    # port endpoint /metrics
+}
+
+def merge_config(defaults, overrides, name):
+    """
+    Salinan `defaults` yang ditimpa `overrides`. Key yang tidak dikenal ditolak
+    agar salah ketik tidak diam-diam diabaikan.
+    """
+    overrides = overrides or {}
+    unknown = sorted(set(overrides) - set(defaults))
+    if unknown:
+        raise TypeError(f"{name}: key tidak dikenal {', '.join(unknown)}")
+    return {**defaults, **overrides}
+
+def scrape_mdpi(topic, years_back, limit, num_workers=4, fetch_mode="http", parse_workers=None,
+                max_attempts=3, base_url=MDPI_BASE_URL, rate=1.0, max_rate=4.0, phase="all",
+                incremental=False, year_from=None, year_to=None, journal=None, depth="full", abort=None,
+                driver_config=None, output_config=None, sync_config=None, metrics_config=None):
+    """
+    Melakukan scraping jurnal MDPI berdasarkan topik dan rentang tahun
+    (`year_from`/`year_to` menggantikan `years_back` jika diberikan; `journal`
+    membatasi crawl ke satu jurnal).
+    Crawl berjalan dalam dua fase sesuai `phase`: harvest mengumpulkan link
+    dari halaman pencarian ke frontier di `<output_dir>/crawl_state.db`
+    (dengan `incremental=True` hanya artikel baru), lalu detail mengambil
+    artikel dari frontier dengan `num_workers` worker (`fetch_mode` "http" atau
+    "selenium"), mem-parse-nya dengan `parse_workers` proses, dan menulisnya ke
+    folder shard. `depth` menentukan field yang diambil (lihat `FIELD_DEPTHS`).
+    Artikel yang sudah selesai dilewati, yang gagal dicoba ulang sampai
+    `max_attempts` kali. Semua request ke `base_url` melewati rate limiter
+    adaptif antara `rate` dan `max_rate` request/detik.
+    Pengaturan browser, output, git sync, dan metrik diberikan lewat
+    `driver_config`, `output_config`, `sync_config`, dan `metrics_config`
+    (lihat `DRIVER_CONFIG`, `OUTPUT_CONFIG`, `SYNC_CONFIG`, `METRICS_CONFIG`).
+    Mengembalikan path folder shard, atau None jika crawl dibatalkan lewat
+    event `abort` atau browser tidak bisa dijalankan.
+    """
+    driver_settings = merge_config(DRIVER_CONFIG, driver_config, "driver_config")
+    resource_policy = driver_settings.pop("resource_policy")
+    output_config = merge_config(OUTPUT_CONFIG, output_config, "output_config")
+    sync_config = merge_config(SYNC_CONFIG, sync_config, "sync_config")
+    metrics_config = merge_config(METRICS_CONFIG, metrics_config, "metrics_config")
+    output_dir = output_config["output_dir"]
+    # Sama seperti indeks pencarian: tidak ada file run yang bocor ke CWD
+    if driver_settings["profile_template"]:
+        driver_settings["profile_template"] = os.path.join(output_dir, driver_settings["profile_template"])
+    if output_config["cache_dir"]:
+        output_config["cache_dir"] = os.path.join(output_dir, output_config["cache_dir"])
+    
+    # 1. Konfigurasi Tanggal
+    current_year = datetime.now().year
+    if year_from is None:
+        year_from = current_year - years_back
+    if year_to is None:
+        year_to = current_year
+    
+    # Timestamp untuk nama file
+    start_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    print(f"[*] Memulai scraping MDPI dengan Selenium...")
+    print(f"[*] Topik: {topic}")
+    print(f"[*] Rentang Tahun: {year_from} - {year_to}")
+    if journal:
+        print(f"[*] Jurnal: {journal}")
+    print(f"[*] Target Jumlah: {limit} artikel")
+    print(f"[*] Kedalaman field: {depth}")
+    if depth == "full":
+        print(f"[*] Jumlah Worker: {num_workers} (mode: {fetch_mode})")
+    print(f"[*] Timestamp: {start_timestamp}")
+    print("-" * 50)
+
+    # Metrik per tahap
+    METRICS.enabled = metrics_config["enabled"]
+    METRICS.reset()
+    NETWORK_USAGE.reset()
+    if metrics_config["enabled"] and metrics_config["file"]:
+        METRICS.start_file_writer(metrics_config["file"])
+    if metrics_config["enabled"] and metrics_config["port"]:
+        METRICS.start_http_server(metrics_config["port"])
+
+    # Setup untuk live saving
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"[*] Folder '{output_dir}' berhasil dibuat.")
+    
+    # Nama file tanpa timestamp agar run berikutnya bisa melanjutkan file yang sama
+    filepath = os.path.join(output_dir, output_name(topic, year_from, year_to, journal, depth))
+    
+    # Status crawl (frontier) untuk resume dan deduplikasi berbasis DOI
+    # Artikel yang selesai di depth rendah belum selesai untuk depth "full"
+    run_key = (f"{topic}|{year_from}-{year_to}" + (f"|{journal}" if journal else "")
+               + (f"|{depth}" if depth != "full" else ""))
+    state = CrawlState(os.path.join(output_dir, "crawl_state.db"), run_key=run_key)
+    saved_count = state.count(STATUS_DONE)
+    if saved_count:
+        print(f"[*] Melanjutkan dari {saved_count} artikel yang sudah ada")
+    
+    # Cache HTML mentah untuk re-parse offline
+    cache = None
+    if output_config["cache_dir"]:
+        cache = HtmlCache(output_config["cache_dir"], max_bytes=int(output_config["cache_max_gb"] * 1024 ** 3),
+                          ttl_seconds=output_config["cache_ttl_days"] * 24 * 3600)
+    
+    # Rate limiter bersama untuk semua request ke MDPI
+    limiter = AdaptiveRateLimiter(rate=rate, max_rate=max(rate, max_rate))
+    
+    writer = None
+    pipeline = None
+    git_sync = None
+    index = None
+
+    def save_article(article_data):
+        # Dipanggil oleh tahap write pipeline sesuai urutan artikel di frontier
+        nonlocal saved_count
+        # Crawl dibatalkan (misalnya lease partisi hilang): jangan menulis apa pun lagi
+        if abort is not None and abort.is_set():
+            return
+        title = article_data["title"]
+        article_key = article_key_for(article_data)
+
+        # Artikel gagal tidak ditulis ke output, akan dicoba ulang di run berikutnya
+        if is_error_content(article_data):
+            state.mark_failed(article_key, article_data["full_content"].get("error"))
+            METRICS.inc("mdpi_articles_total", status="failed")
+            print(f"    ✗ {title[:60]}... (Gagal, dicatat untuk dicoba ulang)")
+            return
+
+        # Live insert: Tambahkan artikel ke shard aktif setiap artikel berhasil diambil
+        try:
+            with METRICS.timer("json_save"):
+                written = writer.write(article_data, key=article_key)
+            state.mark_done(article_key)
+            saved_count += 1
+            METRICS.inc("mdpi_articles_total", status="done")
+            METRICS.inc("mdpi_bytes_total", written, direction="written")
+            print(f"    ✓ [{saved_count}] {title[:60]}... (Tersimpan)")
+        except Exception as e:
+            state.mark_failed(article_key, e)
+            print(f"    ✓ [{saved_count}] {title[:60]}... (Error saving: {e})")
+            return
+
+        # Artikel sudah tersimpan; gagal indeks tidak menggagalkan artikel
+        if index is not None:
+            try:
+                with METRICS.timer("index"):
+                    index.add(article_data, key=article_key, source=filepath)
+            except Exception as e:
+                print(f"    [!] Gagal mengindeks artikel: {e}")
+
+        # Auto-push: commit dan push dilakukan GitSync di background
+        if git_sync is not None:
+            git_sync.submit(writer.take_changed_paths())
+
+    try:
+        # Fase 1: kumpulkan link dari semua halaman pencarian ke frontier
+        if phase in ("harvest", "all"):
+            print("[*] Fase harvest: mengumpulkan link artikel dari halaman pencarian")
+            driver_manager = make_driver_manager(resource_policy, name="search", **driver_settings)
+            try:
+                driver_manager.driver
+            except RuntimeError:
+                return
+            try:
+                added = harvest_links(driver_manager, state, topic, year_from, year_to, limit,
+                                      max_attempts=max_attempts, cache=cache, limiter=limiter,
+                                      base_url=base_url, incremental=incremental, journal=journal,
+                                      with_abstract=depth == "abstract", abort=abort)
+            finally:
+                # Browser pencarian tidak dibutuhkan lagi di fase detail
+                print("[*] Menutup browser...")
+                driver_manager.quit()
+            print(f"[✓] Fase harvest selesai: {added} link baru, "
+                  f"{state.count_open(max_attempts)} artikel menunggu di frontier")
+            print("-" * 50)
+
+        # Fase 2: ambil halaman detail artikel dari frontier
+        if phase in ("detail", "all"):
+            # Mode incremental: `limit` berlaku untuk artikel baru, bukan total
+            detail_limit = limit if incremental else max(limit - saved_count, 0)
+            frontier = state.retry_candidates(max_attempts, limit=detail_limit)
+            print(f"[*] Fase detail: {len(frontier)} artikel dari frontier")
+            writer = ShardedWriter(filepath, shard_size=output_config["shard_size"],
+                                   fsync_every=output_config["fsync_every"])
+            if output_config["search_index"]:
+                search_index = os.path.join(output_dir, output_config["search_index"])
+                index = SearchIndex(search_index)
+            if sync_config["auto_push"]:
+                # Hanya push jika folder output berada di repository git
+                repo_dir = find_repo_root(output_dir)
+                if repo_dir:
+                    git_sync = GitSync(repo_dir, remote=sync_config["git_remote"], branch=sync_config["git_branch"],
+                                       batch_size=sync_config["push_every"],
+                                       batch_seconds=sync_config["push_interval"],
+                                       label=os.path.basename(filepath))
+                else:
+                    print("[*] Folder output bukan repository git atau git tidak dikonfigurasi; melewatkan auto-push.")
             
-            # Break jika sudah mencapai limit
-            if len(articles_data) >= limit:
-                break
+            if depth != "full":
+                # Semua field sudah ada dari halaman pencarian, tidak ada halaman artikel yang dibuka
+                for article_key, base_data in frontier:
+                    if abort is not None and abort.is_set():
+                        break
+                    save_article(build_listing_data(base_data, depth))
+            else:
+                # Setup pipeline fetch/parse/write untuk halaman detail artikel
+                pipeline = ArticlePipeline(num_workers, on_result=save_article, parse_workers=parse_workers,
+                                           fetch_mode=fetch_mode, cache=cache, limiter=limiter,
+                                           resource_policy=resource_policy, driver_settings=driver_settings)
+                if not len(pipeline):
+                    print("[!] Tidak ada worker yang berhasil dijalankan.")
+                    if git_sync is not None:
+                        git_sync.close()
+                    return
                 
+                for article_key, base_data in frontier:
+                    if abort is not None and abort.is_set():
+                        break
+                    state.mark_pending(article_key)
+                    print(f"    └ Mengantrikan konten lengkap untuk: {base_data['title'][:40]}...")
+                    pipeline.submit(base_data["link"], base_data)
+    
     except Exception as e:
         print(f"[!] Error umum: {e}")
     finally:
-        # Tutup browser
-        print("[*] Menutup browser...")
-        driver.quit()
+        # Tunggu worker menyelesaikan antrian
+        if pipeline is not None:
+            print("[*] Menunggu worker menyelesaikan antrian...")
+            pipeline.close()
+            if len(pipeline):
+                pipeline.report()
+            limiter_stats = limiter.summary()
+            print(f"[*] Rate limiter: {limiter_stats['requests']} request, laju akhir {limiter_stats['rate']:.2f} request/detik, "
+                  f"{limiter_stats['throttles']} throttle, {limiter_stats['errors']} error, "
+                  f"total menunggu {limiter_stats['wait_seconds']:.1f} detik")
+        NETWORK_USAGE.report()
+        if writer is not None:
+            writer.close()
+        if index is not None:
+            print(f"[*] Indeks pencarian: {index.count()} artikel di '{search_index}'")
+            index.close()
+        failed_count = state.count(STATUS_FAILED)
+        if failed_count:
+            print(f"[!] {failed_count} artikel gagal, akan dicoba ulang pada run berikutnya")
+        state.close()
+        if cache:
+            cache.close()
+        METRICS.stop()
+
+    if abort is not None and abort.is_set():
+        print("[!] Crawl dibatalkan, output tidak di-finalisasi")
+        if git_sync is not None:
+            git_sync.close()
+        return None
 
- 
+    if writer is None:
+        # Hanya fase harvest yang dijalankan, belum ada output artikel
+        return filepath
 
     # Final save dan push
     print("-" * 50)
-    print(f"[✓] Selesai! {len(articles_data)} artikel berhasil disimpan ke '{filepath}'")
+    print(f"[✓] Selesai! {saved_count} artikel berhasil disimpan ke '{filepath}'")
 
-    # Final push setelah selesai semua
-    print(f"[*] Melakukan final push untuk {len(articles_data)} artikel...")
-    try:
-        # Only attempt to push if this folder is a git repo
-        repo_root = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
-        if repo_root.returncode == 0:
-            git_push_function(filepath)
+    # Konversi shard ke JSON array (format output lama)
+    if output_config["compact_output"]:
+        try:
+            with METRICS.timer("compact"):
+                json_path, total = compact_jsonl(filepath)
+            print(f"[✓] {total} artikel dikonversi ke '{json_path}'")
+        except Exception as e:
+            print(f"[!] Error saat konversi shard ke JSON: {e}")
+
+    # Final push: flush sisa batch shard yang belum di-commit/push. File JSON
+    # hasil compact tidak ikut, karena seluruh array akan di-commit ulang setiap run.
+    if git_sync is not None:
+        print(f"[*] Melakukan final push untuk {saved_count} artikel...")
+        git_sync.close()
+        git_sync.report()
+
+    if metrics_config["enabled"]:
+        write_metrics_report(filepath, metrics_config["file"])
+
+    return filepath
+
+def reparse_from_cache(topic, years_back, cache_dir="html_cache", compact_output=True,
+                       parse_workers=None, output_dir="output", base_url=MDPI_BASE_URL,
+                       year_from=None, year_to=None, journal=None, depth="full", shard_size=500):
+    """
+    Membangun ulang output dari HTML yang tersimpan di cache tanpa membuka browser.
+    Parameter run (tahun, jurnal, depth, base_url) sama dengan `scrape_mdpi`,
+    karena halaman dicari di cache berdasarkan URL-nya. Halaman pencarian
+    dibaca berurutan mulai halaman 1 sampai tidak ada di cache, lalu artikel
+    setiap halaman di-ekstrak ulang dengan `extract_article_content` secara
+    paralel oleh `parse_workers` proses (default: jumlah core CPU). Hasilnya
+    ditulis ke folder shard `<nama output>_reparsed`. `cache_dir` relatif
+    terhadap `output_dir`, seperti di `scrape_mdpi`.
+    """
+    current_year = datetime.now().year
+    if year_from is None:
+        year_from = current_year - years_back
+    if year_to is None:
+        year_to = current_year
+
+    cache_dir = os.path.join(output_dir, cache_dir)
+    if not os.path.exists(os.path.join(cache_dir, "index.db")):
+        print(f"[!] Cache '{cache_dir}' tidak ditemukan.")
+        return
+
+    print(f"[*] Re-parse dari cache: {cache_dir}")
+    print(f"[*] Topik: {topic}")
+    print(f"[*] Rentang Tahun: {year_from} - {year_to}")
+    if journal:
+        print(f"[*] Jurnal: {journal}")
+    print(f"[*] Kedalaman field: {depth}")
+    print("-" * 50)
+
+    cache = HtmlCache(cache_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, output_name(topic, year_from, year_to, journal, depth) + "_reparsed")
+    if os.path.exists(filepath):
+        shutil.rmtree(filepath)
+
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+    executor = None
+    if parse_workers and depth == "full":
+        executor = ProcessPoolExecutor(max_workers=parse_workers,
+                                       mp_context=multiprocessing.get_context("spawn"))
+
+    def parse_all(htmls):
+        # Error pada satu halaman hanya menggagalkan artikel tersebut
+        if executor is None:
+            futures = None
         else:
-            print("[*] Folder ini bukan repository git atau git tidak dikonfigurasi; melewatkan auto-push.")
-    except Exception as e:
-        print(f"[*] Git tidak tersedia atau terjadi error saat memeriksa repository: {e}")
+            futures = [executor.submit(extract_article_content, html) for html in htmls]
+        results = []
+        for i, html in enumerate(htmls):
+            try:
+                results.append(futures[i].result() if futures else extract_article_content(html))
+            except Exception as e:
+                print(f"    [!] Error parse artikel: {e}")
+                results.append(error_article_content(e))
+        return results
+
+    started = time.time()
+    seen_keys = set()
+    saved_count = 0
+    missing_count = 0
+    page = 1
+    with ShardedWriter(filepath, shard_size=shard_size, fsync_every=0) as writer:
+        while True:
+            html = cache.get(build_search_url(topic, year_from, year_to, page, base_url, journal),
+                             ignore_ttl=True)
+            if html is None:
+                break
+
+            _, article_items = parse_search_page(html)
+            jobs = []
+            for item in article_items:
+                base_data = parse_search_item(item, base_url, depth == "abstract")
+                if not base_data:
+                    continue
+                article_key = article_key_for(base_data)
+                if article_key in seen_keys:
+                    continue
+
+                if depth != "full":
+                    # Semua field ada di halaman pencarian
+                    seen_keys.add(article_key)
+                    writer.write(build_listing_data(base_data, depth), key=article_key)
+                    saved_count += 1
+                    continue
+
+                article_html = cache.get(base_data["link"], ignore_ttl=True)
+                if article_html is None:
+                    missing_count += 1
+                    continue
+
+                seen_keys.add(article_key)
+                jobs.append((article_key, base_data, article_html))
+
+            # Ekstraksi paralel, hasil tetap ditulis sesuai urutan halaman pencarian
+            contents = parse_all([article_html for _, _, article_html in jobs])
+            for (article_key, base_data, _), article_content in zip(jobs, contents):
+                writer.write(build_article_data(base_data, article_content), key=article_key)
+                saved_count += 1
+            page += 1
+
+    if executor is not None:
+        executor.shutdown()
+    cache.close()
+    elapsed = time.time() - started
+    print(f"[✓] {saved_count} artikel dari {page - 1} halaman di-parse ulang dalam {elapsed:.1f} detik")
+    if missing_count:
+        print(f"[!] {missing_count} artikel tidak ada di cache dan dilewati")
+    print(f"[✓] Tersimpan ke '{filepath}'")
+
+    if compact_output:
+        json_path, total = compact_jsonl(filepath)
+        print(f"[✓] {total} artikel dikonversi ke '{json_path}'")
+    return filepath
 
 # --- KONFIGURASI PENGGUNAAN ---
 if __name__ == "__main__":
@@ -476,5 +1406,59 @@ if __name__ == "__main__":
     TOPIK = "computer science"  # Topik pencarian
     TAHUN_KEBELAKANG = 5        # Rentang tahun (misal: 5 tahun terakhir)
     JUMLAH_AMBIL = 1000         # Jumlah jurnal yang ingin diambil (testing dengan jumlah kecil dulu)
+    JUMLAH_WORKER = 4           # Jumlah worker paralel untuk halaman detail artikel
+    MODE_FETCH = "http"         # "http" (fallback ke Selenium) atau "selenium"
+    JUMLAH_PROSES_PARSER = None # Jumlah proses parser (None = semua core CPU, 0 = tanpa process pool)
+    FSYNC_SETIAP = 10           # fsync file JSONL setiap N artikel
+    CACHE_DIR = "html_cache"    # Folder cache HTML mentah di folder output (None untuk menonaktifkan)
+    CACHE_MAKS_GB = 2           # Batas ukuran cache, entri lama dihapus (LRU)
+    CACHE_TTL_HARI = 30         # Umur maksimum entri cache
+    UKURAN_SHARD = 500          # Jumlah artikel per shard .jsonl.gz
+    KEDALAMAN_FIELD = "full"    # "listing", "abstract" (tanpa membuka halaman artikel), atau "full"
+    INDEKS_PENCARIAN = "search_index.db"  # Indeks full-text FTS5 di folder output (None untuk menonaktifkan)
+    PUSH_SETIAP = 50            # Commit & push output setiap N artikel (di background)
+    INTERVAL_PUSH_DETIK = 300   # ...atau setiap N detik jika masih ada artikel yang belum di-push
+    METRIK_AKTIF = True         # Catat durasi per tahap dan counter crawl
+    METRIK_FILE = "output/metrics.prom"  # File metrik Prometheus (None untuk menonaktifkan)
+    METRIK_PORT = None          # Port endpoint /metrics (None untuk menonaktifkan)
+    LAJU_AWAL = 1.0             # Laju awal request ke MDPI (request/detik)
+    LAJU_MAKS = 4.0             # Laju maksimum saat respons sehat
+    RESOURCE_DIBLOKIR = ["image", "font", "media", "analytics", "mathjax", "widgets"]  # [] untuk tidak memblokir
+    DAUR_ULANG_SETIAP = 200     # Restart browser setiap N halaman (0 = tidak pernah)
+    MAKS_RSS_BROWSER_MB = 1500  # Restart browser jika memori Chrome melewati batas ini
+    PROFIL_CHROME = "chrome_profile"  # Profil Chrome hangat di folder output (None untuk profil baru setiap kali)
+    
+    parser = argparse.ArgumentParser(description="Scraper jurnal MDPI")
+    parser.add_argument("--reparse-from-cache", action="store_true",
+                        help="Bangun ulang output dari cache HTML tanpa membuka browser")
+    parser.add_argument("--phase", choices=["harvest", "detail", "all"], default="all",
+                        help="harvest: kumpulkan link ke frontier, detail: ambil artikel dari frontier")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Hanya ambil artikel yang terbit sejak run sebelumnya (untuk update harian)")
+    parser.add_argument("--depth", choices=FIELD_DEPTHS, default=KEDALAMAN_FIELD,
+                        help="listing: field halaman pencarian, abstract: + abstract dari halaman pencarian, full: konten lengkap")
+    args = parser.parse_args()
     
-    scrape_mdpi(TOPIK, TAHUN_KEBELAKANG, JUMLAH_AMBIL)
\ No newline at end of file
+    if args.reparse_from_cache:
+        reparse_from_cache(TOPIK, TAHUN_KEBELAKANG, cache_dir=CACHE_DIR, parse_workers=JUMLAH_PROSES_PARSER,
+                           depth=args.depth, shard_size=UKURAN_SHARD)
+    else:
+        scrape_mdpi(TOPIK, TAHUN_KEBELAKANG, JUMLAH_AMBIL, num_workers=JUMLAH_WORKER, fetch_mode=MODE_FETCH,
+                    parse_workers=JUMLAH_PROSES_PARSER, rate=LAJU_AWAL, max_rate=LAJU_MAKS,
+                    phase=args.phase, incremental=args.incremental, depth=args.depth,
+                    driver_config={
+                        "resource_policy": ResourcePolicy(RESOURCE_DIBLOKIR) if RESOURCE_DIBLOKIR else None,
+                        "recycle_pages": DAUR_ULANG_SETIAP,
+                        "max_rss_mb": MAKS_RSS_BROWSER_MB,
+                        "profile_template": PROFIL_CHROME,
+                    },
+                    output_config={
+                        "shard_size": UKURAN_SHARD,
+                        "fsync_every": FSYNC_SETIAP,
+                        "search_index": INDEKS_PENCARIAN,
+                        "cache_dir": CACHE_DIR,
+                        "cache_max_gb": CACHE_MAKS_GB,
+                        "cache_ttl_days": CACHE_TTL_HARI,
+                    },
+                    sync_config={"push_every": PUSH_SETIAP, "push_interval": INTERVAL_PUSH_DETIK},
+                    metrics_config={"enabled": METRIK_AKTIF, "file": METRIK_FILE, "port": METRIK_PORT})
\ No newline at end of file
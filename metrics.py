@@ -0,0 +1,244 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Batas bucket histogram durasi (detik)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Deskripsi metrik untuk baris HELP di format Prometheus
+METRIC_HELP = {
+    "mdpi_stage_seconds": "Durasi setiap tahap crawler",
+    "mdpi_pages_total": "Jumlah halaman yang diambil",
+    "mdpi_articles_total": "Jumlah artikel yang selesai diproses",
+    "mdpi_retries_total": "Jumlah percobaan ulang",
+    "mdpi_timeouts_total": "Jumlah timeout",
+    "mdpi_bytes_total": "Jumlah bytes yang diambil, ditulis, atau (perkiraan) dihemat",
+    "mdpi_blocked_requests_total": "Jumlah request browser yang diblokir kebijakan resource",
+}
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("metrics", "stage", "started")
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.stage, time.perf_counter() - self.started)
+        return False
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+
+class Metrics:
+    """
+    Registry metrik ringan: histogram durasi per tahap dan counter berlabel.
+    Saat `enabled` False semua pemanggilan langsung kembali tanpa mencatat,
+    sehingga instrumentasi bisa dibiarkan di hot path.
+    """
+
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.histograms = {}
+        self.counters = {}
+        self._server = None
+        self._writer_stop = None
+
+    def reset(self):
+        with self.lock:
+            self.started_at = time.time()
+            self.histograms = {}
+            self.counters = {}
+
+    # --- Pencatatan ---
+
+    def timer(self, stage):
+        """
+        Context manager yang mencatat durasi blok ke histogram `stage`.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    def observe(self, stage, seconds):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name, value=1, **labels):
+        """
+        Menambah counter `name` dengan label tertentu, misalnya
+        `inc("mdpi_pages_total", kind="article", source="http")`.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    # --- Ekspor ---
+
+    def to_prometheus(self):
+        """
+        Semua metrik dalam format teks eksposisi Prometheus.
+        """
+        lines = []
+        with self.lock:
+            if self.histograms:
+                lines.append(f"# HELP mdpi_stage_seconds {METRIC_HELP['mdpi_stage_seconds']}")
+                lines.append("# TYPE mdpi_stage_seconds histogram")
+                for stage in sorted(self.histograms):
+                    histogram = self.histograms[stage]
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'mdpi_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                    lines.append(f'mdpi_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                    lines.append(f'mdpi_stage_seconds_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                    lines.append(f'mdpi_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+            names = sorted({name for name, _ in self.counters})
+            for name in names:
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+                for (counter_name, labels), value in sorted(self.counters.items()):
+                    if counter_name != name:
+                        continue
+                    label_text = ",".join(f'{key}="{val}"' for key, val in labels)
+                    lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """
+        Ringkasan metrik sebagai dict (untuk JSON di akhir run).
+        """
+        with self.lock:
+            stages = {
+                stage: {
+                    "count": histogram.count,
+                    "total_seconds": round(histogram.sum, 6),
+                    "mean_seconds": round(histogram.sum / histogram.count, 6) if histogram.count else 0.0,
+                    "max_seconds": round(histogram.max, 6),
+                }
+                for stage, histogram in sorted(self.histograms.items())
+            }
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                label_text = ",".join(f"{key}={val}" for key, val in labels)
+                counters[f"{name}{{{label_text}}}" if label_text else name] = value
+        return {
+            "duration_seconds": round(time.time() - self.started_at, 3),
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def write_prometheus(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def write_summary(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=4)
+
+    def start_file_writer(self, path, interval=15):
+        """
+        Menulis file Prometheus (untuk node_exporter textfile collector) setiap
+        `interval` detik di thread background.
+        """
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                try:
+                    self.write_prometheus(path)
+                except OSError as e:
+                    print(f"[!] Error menulis metrik ke '{path}': {e}")
+
+        self._writer_stop = stop
+        threading.Thread(target=loop, name="metrics-writer", daemon=True).start()
+
+    def start_http_server(self, port, host="0.0.0.0"):
+        """
+        Menyajikan metrik di http://host:port/metrics.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"[*] Endpoint metrik: http://{host}:{port}/metrics")
+
+    def stop(self):
+        if self._writer_stop is not None:
+            self._writer_stop.set()
+            self._writer_stop = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Instance global yang dipakai seluruh crawler; diaktifkan oleh scrape_mdpi
+METRICS = Metrics()
@@ -0,0 +1,339 @@
+import gzip
+import json
+import os
+import re
+import sys
+
+
+SHARD_PATTERN = re.compile(r"^shard-(\d{5})\.jsonl\.gz$")
+
+
+class JsonlWriter:
+    """
+    Writer append-only yang menulis satu artikel per baris (JSON Lines).
+    Setiap artikel hanya diserialisasi sekali, sehingga biaya tulis tetap
+    konstan per artikel dan data tidak perlu disimpan di memori.
+    """
+
+    def __init__(self, filepath, fsync_every=10):
+        self.filepath = filepath
+        self.fsync_every = fsync_every
+        self.count = 0
+        self.bytes_written = 0
+        self._unsynced = 0
+        self._file = open(filepath, 'ab')
+
+    def write(self, record):
+        """
+        Menambahkan satu record ke akhir file, fsync setiap `fsync_every` record.
+        Mengembalikan jumlah bytes yang ditulis.
+        """
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        self._file.write(line)
+        self._file.flush()
+        self.count += 1
+        self.bytes_written += len(line)
+        self._unsynced += 1
+        if self.fsync_every and self._unsynced >= self.fsync_every:
+            self.sync()
+        return len(line)
+
+    def sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ShardedWriter:
+    """
+    Writer output ber-shard: artikel ditulis ke `shard-NNNNN.jsonl.gz` di
+    `shard_dir`, maksimal `shard_size` artikel per shard. Setiap artikel
+    disimpan sebagai member gzip tersendiri, sehingga shard tetap append-only
+    (shard lama tidak pernah berubah) dan satu artikel bisa dibaca langsung
+    dari offset-nya. Indeks per shard (`shard-NNNNN.index.jsonl`) memetakan
+    kunci artikel (DOI atau link) ke offset dan panjang member di shard.
+    Run berikutnya melanjutkan shard terakhir yang belum penuh.
+    """
+
+    def __init__(self, shard_dir, shard_size=500, fsync_every=10):
+        self.shard_dir = shard_dir
+        self.shard_size = shard_size
+        self.fsync_every = fsync_every
+        self.count = 0
+        self.bytes_written = 0
+        self.changed_paths = set()
+        self._unsynced = 0
+        self._shard = None
+        self._index = None
+        os.makedirs(shard_dir, exist_ok=True)
+
+        shard_numbers = list_shards(shard_dir)
+        self.shard_no = shard_numbers[-1] if shard_numbers else 0
+        entries = _repair_shard(shard_dir, self.shard_no)
+        self.shard_count = len(entries)
+        if self.shard_count >= shard_size:
+            self.shard_no += 1
+            self.shard_count = 0
+        self._open_shard()
+
+    def _open_shard(self):
+        shard_path, index_path = shard_paths(self.shard_dir, self.shard_no)
+        self._shard = open(shard_path, 'ab')
+        self._offset = self._shard.tell()
+        self._index = open(index_path, 'a', encoding='utf-8')
+
+    def _close_shard(self):
+        for f in (self._shard, self._index):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+
+    def write(self, record, key=None):
+        """
+        Menambahkan satu artikel ke shard aktif; `key` (default: link) dicatat
+        di indeks. Mengembalikan jumlah bytes (terkompresi) yang ditulis.
+        """
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        member = gzip.compress(data, mtime=0)
+        self._shard.write(member)
+        self._shard.flush()
+        # Indeks ditulis setelah data, jadi entri indeks selalu menunjuk data utuh
+        entry = {"key": key or record.get("link"), "offset": self._offset, "length": len(member)}
+        self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._index.flush()
+        self._offset += len(member)
+
+        self.changed_paths.update(shard_paths(self.shard_dir, self.shard_no))
+        self.count += 1
+        self.bytes_written += len(member)
+        self.shard_count += 1
+        self._unsynced += 1
+        if self.shard_count >= self.shard_size:
+            # Shard penuh: tutup (fsync) dan mulai shard berikutnya
+            self._close_shard()
+            self.shard_no += 1
+            self.shard_count = 0
+            self._unsynced = 0
+            self._open_shard()
+        elif self.fsync_every and self._unsynced >= self.fsync_every:
+            self.sync()
+        return len(member)
+
+    def take_changed_paths(self):
+        """
+        Path shard dan indeks yang baru atau berubah sejak pemanggilan
+        sebelumnya (untuk di-stage ke git). Data sudah di-flush setiap write,
+        jadi isinya terbaca oleh git walau belum di-fsync.
+        """
+        paths = sorted(self.changed_paths)
+        self.changed_paths = set()
+        return paths
+
+    def sync(self):
+        if self._shard.closed:
+            return
+        for f in (self._shard, self._index):
+            f.flush()
+            os.fsync(f.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if self._shard.closed:
+            return
+        self._close_shard()
+        # Shard kosong yang baru dibuka tidak perlu disimpan
+        shard_path, index_path = shard_paths(self.shard_dir, self.shard_no)
+        if self.shard_count == 0 and os.path.getsize(shard_path) == 0:
+            os.remove(shard_path)
+            os.remove(index_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def shard_paths(shard_dir, shard_no):
+    """
+    Path file shard dan file indeksnya.
+    """
+    name = f"shard-{shard_no:05d}"
+    return os.path.join(shard_dir, name + ".jsonl.gz"), os.path.join(shard_dir, name + ".index.jsonl")
+
+
+def list_shards(shard_dir):
+    """
+    Nomor shard yang ada di `shard_dir`, terurut.
+    """
+    if not os.path.isdir(shard_dir):
+        return []
+    return sorted(int(match.group(1)) for match in map(SHARD_PATTERN.match, os.listdir(shard_dir)) if match)
+
+
+def _read_index(index_path):
+    entries = []
+    if not os.path.exists(index_path):
+        return entries
+    with open(index_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return entries
+
+
+def _repair_shard(shard_dir, shard_no):
+    """
+    Membuang sisa tulisan yang terpotong (crash) di akhir shard dan indeksnya,
+    lalu mengembalikan entri indeks yang valid.
+    """
+    shard_path, index_path = shard_paths(shard_dir, shard_no)
+    shard_size = os.path.getsize(shard_path) if os.path.exists(shard_path) else 0
+    entries = [entry for entry in _read_index(index_path) if entry["offset"] + entry["length"] <= shard_size]
+    end = entries[-1]["offset"] + entries[-1]["length"] if entries else 0
+
+    if shard_size != end:
+        with open(shard_path, 'r+b') as f:
+            f.truncate(end)
+    index_text = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+    if os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            current = f.read()
+        if current != index_text:
+            with open(index_path, 'w', encoding='utf-8') as f:
+                f.write(index_text)
+    return entries
+
+
+def load_manifest(shard_dir):
+    """
+    Manifest seluruh shard: dict kunci artikel (DOI atau link) ke tuple
+    (path shard, offset, panjang).
+    """
+    manifest = {}
+    for shard_no in list_shards(shard_dir):
+        shard_path, index_path = shard_paths(shard_dir, shard_no)
+        for entry in _read_index(index_path):
+            manifest[entry["key"]] = (shard_path, entry["offset"], entry["length"])
+    return manifest
+
+
+def read_article(shard_dir, key, manifest=None):
+    """
+    Membaca satu artikel berdasarkan kunci tanpa membuka shard lain.
+    Mengembalikan dict artikel atau None jika tidak ada.
+    """
+    manifest = manifest if manifest is not None else load_manifest(shard_dir)
+    location = manifest.get(key)
+    if location is None:
+        return None
+    shard_path, offset, length = location
+    with open(shard_path, 'rb') as f:
+        f.seek(offset)
+        return json.loads(gzip.decompress(f.read(length)))
+
+
+def iter_shards(shard_dir):
+    """
+    Membaca semua artikel di folder shard sesuai urutan tulis.
+    """
+    for shard_no in list_shards(shard_dir):
+        shard_path, index_path = shard_paths(shard_dir, shard_no)
+        with open(shard_path, 'rb') as f:
+            for entry in _read_index(index_path):
+                f.seek(entry["offset"])
+                yield json.loads(gzip.decompress(f.read(entry["length"])))
+
+
+def iter_records(path):
+    """
+    Membaca artikel dari folder shard atau file JSONL.
+    """
+    if os.path.isdir(path):
+        return iter_shards(path)
+    return iter_jsonl(path)
+
+
+def iter_jsonl(filepath):
+    """
+    Membaca record dari file JSONL satu per satu. Baris rusak (misalnya baris
+    terakhir yang terpotong karena crash) dilewati.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"[!] Baris {line_no} di '{filepath}' rusak, dilewati.")
+
+
+def compact_jsonl(jsonl_path, json_path=None):
+    """
+    Mengonversi file JSONL (atau folder shard) menjadi JSON array ber-indentasi
+    (format output lama). Record ditulis secara streaming, duplikat berdasarkan
+    `link` dibuang. Mengembalikan path file JSON dan jumlah artikel yang ditulis.
+    """
+    if json_path is None:
+        if os.path.isdir(jsonl_path):
+            json_path = jsonl_path.rstrip(os.sep) + ".json"
+        else:
+            json_path = os.path.splitext(jsonl_path)[0] + ".json"
+
+    seen_links = set()
+    written = 0
+    tmp_path = json_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        out.write("[")
+        for record in iter_records(jsonl_path):
+            link = record.get("link")
+            if link:
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+
+            # Hasil identik dengan json.dump(list, indent=4)
+            item = json.dumps(record, ensure_ascii=False, indent=4)
+            item = "\n".join("    " + line for line in item.split("\n"))
+            out.write(("," if written else "") + "\n" + item)
+            written += 1
+        out.write("\n]" if written else "]")
+    os.replace(tmp_path, json_path)
+
+    return json_path, written
+
+
+if __name__ == "__main__":
+    # Penggunaan: python output_writer.py <file.jsonl|folder shard> [file.json]
+    #             python output_writer.py get <folder shard> <doi|link>
+    if len(sys.argv) < 2:
+        print("Penggunaan: python output_writer.py <file.jsonl|folder shard> [file.json]")
+        print("            python output_writer.py get <folder shard> <doi|link>")
+        sys.exit(1)
+
+    if sys.argv[1] == "get":
+        article = read_article(sys.argv[2], sys.argv[3])
+        if article is None:
+            print(f"[!] Artikel '{sys.argv[3]}' tidak ada di manifest")
+            sys.exit(1)
+        print(json.dumps(article, ensure_ascii=False, indent=4))
+        sys.exit(0)
+
+    target_path, total = compact_jsonl(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"[✓] {total} artikel ditulis ke '{target_path}'")
@@ -0,0 +1,347 @@
+from bs4 import BeautifulSoup, SoupStrainer
+import gzip
+import os
+import sys
+import time
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_BACKEND = "lxml"
+except ImportError:
+    DEFAULT_BACKEND = "html.parser"
+
+
+# Parser lama (pure Python, seluruh dokumen) sebagai acuan perbandingan
+BASELINE_BACKEND = "html.parser"
+
+# Container yang dipakai saat ekstraksi. Selector fallback yang tidak tercakup
+# strainer (section#abstract, div.art-abstract, article, section#references)
+# ditangani dengan parse ulang seluruh dokumen.
+ARTICLE_CONTAINER_CLASSES = ["html-abstract", "abstract", "art-keywords", "html-body",
+                             "article-content", "html-references"]
+SEARCH_CONTAINER_CLASSES = ["generic-item", "article-item"]
+
+ARTICLE_STRAINER = SoupStrainer('div', attrs={'class': ARTICLE_CONTAINER_CLASSES})
+SEARCH_STRAINER = SoupStrainer('div', attrs={'class': SEARCH_CONTAINER_CLASSES})
+
+
+def make_soup(html, backend=None, parse_only=None):
+    """
+    Membuat BeautifulSoup dengan backend yang dipilih (default: lxml jika terpasang).
+    `parse_only` membatasi tree hanya pada elemen yang cocok dengan strainer.
+    """
+    return BeautifulSoup(html, backend or DEFAULT_BACKEND, parse_only=parse_only)
+
+
+def find_search_items(soup):
+    """
+    Mencari elemen artikel di halaman hasil pencarian MDPI.
+    """
+    # Mencari artikel berdasarkan berbagai kemungkinan struktur
+    article_items = soup.find_all('div', class_='generic-item article-item')
+
+    # Jika tidak ditemukan, coba alternatif lain
+    if not article_items:
+        article_items = soup.find_all('div', class_='generic-item')
+        article_items = [item for item in article_items if 'article-item' in item.get('class', [])]
+
+    if not article_items:
+        article_items = soup.find_all('article')
+
+    return article_items
+
+
+def parse_search_page(html, backend=None, targeted=True):
+    """
+    Mem-parse halaman hasil pencarian. Dengan `targeted=True` hanya elemen
+    `generic-item`/`article-item` yang dibangun; jika tidak ada yang cocok,
+    seluruh dokumen di-parse ulang agar fallback `<article>` tetap berlaku.
+    Mengembalikan tuple (soup, article_items).
+    """
+    if targeted:
+        soup = make_soup(html, backend, parse_only=SEARCH_STRAINER)
+        article_items = find_search_items(soup)
+        if article_items:
+            return soup, article_items
+
+    soup = make_soup(html, backend)
+    return soup, find_search_items(soup)
+
+
+def parse_search_item(item, base_url="https://www.mdpi.com", with_abstract=False):
+    """
+    Mengambil title, authors, journal, dan link dari satu elemen hasil pencarian.
+    Dengan `with_abstract=True` abstract lengkap di elemen tersebut juga diambil.
+    Mengembalikan None jika elemen tidak memiliki link judul.
+    """
+    # Ambil title dan link
+    title_link = item.find('a', class_='title-link')
+    if not title_link:
+        return None
+
+    title = title_link.get_text(strip=True)
+    link = base_url + title_link.get('href', '')
+
+    # Ambil authors
+    authors_div = item.find('div', class_='authors')
+    authors = authors_div.get_text(strip=True) if authors_div else "No Authors"
+
+    # Ambil journal info
+    journal_div = item.find('div', class_='color-grey-dark')
+    journal_info = journal_div.get_text(strip=True) if journal_div else "Unknown Journal"
+
+    base_data = {
+        "title": title,
+        "authors": authors,
+        "journal": journal_info,
+        "link": link
+    }
+    if with_abstract:
+        abstract = extract_search_abstract(item)
+        base_data["abstract"] = abstract if abstract is not None else "Abstract not found"
+    return base_data
+
+
+def extract_search_abstract(item):
+    """
+    Abstract lengkap dari satu elemen hasil pencarian. MDPI menyertakan
+    `div.abstract-full` (disembunyikan sampai "Read more" diklik) di HTML
+    halaman pencarian, jadi 50 abstract didapat dari satu halaman tanpa
+    membuka halaman artikel. Mengembalikan None jika tidak ada.
+    """
+    abstract_div = item.find('div', class_='abstract-full')
+    if not abstract_div:
+        return None
+    # Buang link "Full article" / "Show Figures" di akhir abstract
+    for link in abstract_div.find_all('a'):
+        link.decompose()
+    abstract_text = abstract_div.get_text(strip=True)
+    if abstract_text.lower().startswith('abstract'):
+        abstract_text = abstract_text[8:].strip()
+    return abstract_text
+
+
+def extract_article_content(html, backend=None, targeted=True):
+    """
+    Mengekstrak abstract, keywords, section, dan references dari HTML halaman
+    detail artikel MDPI. Dipakai bersama oleh jalur Selenium dan jalur HTTP.
+    Dengan `targeted=True` hanya container yang dipakai yang di-parse; jika
+    salah satu container utama tidak ada, seluruh dokumen di-parse ulang
+    sehingga hasilnya sama dengan parse penuh.
+    """
+    if targeted:
+        soup = make_soup(html, backend, parse_only=ARTICLE_STRAINER)
+        article_content = extract_from_soup(soup, full_tree=False)
+        if article_content is not None:
+            return article_content
+
+    return extract_from_soup(make_soup(html, backend), full_tree=True)
+
+
+def extract_article_content_timed(html, backend=None):
+    """
+    Sama dengan `extract_article_content`, tetapi juga mengembalikan lama parse
+    (detik). Dipakai oleh proses parser di pipeline.
+    """
+    started = time.perf_counter()
+    article_content = extract_article_content(html, backend)
+    return article_content, time.perf_counter() - started
+
+
+def extract_from_soup(soup, full_tree=True):
+    """
+    Ekstraksi konten artikel dari soup. Jika `full_tree` False (soup hasil
+    strainer), mengembalikan None ketika dibutuhkan selector fallback yang
+    tidak tercakup strainer.
+    """
+    article_content = {}
+
+    # 1. Ambil Abstract
+    abstract_div = soup.find('div', class_='html-abstract')
+    if not abstract_div:
+        abstract_div = soup.find('div', class_='abstract')
+    if not abstract_div and not full_tree:
+        return None
+    if not abstract_div:
+        abstract_div = soup.find('section', {'id': 'abstract'})
+    if not abstract_div:
+        abstract_div = soup.find('div', class_='art-abstract')
+
+    if abstract_div:
+        abstract_text = abstract_div.get_text(strip=True)
+        if abstract_text.lower().startswith('abstract'):
+            abstract_text = abstract_text[8:].strip()
+        article_content['abstract'] = abstract_text
+    else:
+        article_content['abstract'] = "Abstract not found"
+
+    # 2. Ambil Keywords
+    keywords_section = soup.find('div', class_='art-keywords')
+    if keywords_section:
+        keywords = keywords_section.get_text(strip=True)
+        if keywords.lower().startswith('keywords'):
+            keywords = keywords[8:].strip()
+        article_content['keywords'] = keywords
+    else:
+        article_content['keywords'] = "Keywords not found"
+
+    # 3. Ambil konten utama artikel
+    # MDPI biasanya menyimpan konten dalam div dengan class 'html-body' atau 'article-content'
+    main_content_div = soup.find('div', class_='html-body')
+    if not main_content_div:
+        main_content_div = soup.find('div', class_='article-content')
+    if not main_content_div and not full_tree:
+        return None
+    if not main_content_div:
+        main_content_div = soup.find('article')
+
+    if main_content_div:
+        # Ambil semua section dalam artikel
+        sections = {}
+
+        # Cari section berdasarkan heading (h2, h3)
+        headings = main_content_div.find_all(['h2', 'h3', 'h4'])
+
+        for i, heading in enumerate(headings):
+            section_title = heading.get_text(strip=True)
+
+            # Ambil konten antara heading ini dan heading berikutnya
+            content_elements = []
+            next_sibling = heading.next_sibling
+
+            while next_sibling:
+                # Stop jika menemukan heading berikutnya
+                if hasattr(next_sibling, 'name') and next_sibling.name in ['h2', 'h3', 'h4']:
+                    break
+
+                if hasattr(next_sibling, 'get_text'):
+                    text = next_sibling.get_text(strip=True)
+                    if text:  # Skip elemen kosong
+                        content_elements.append(text)
+
+                next_sibling = next_sibling.next_sibling
+
+            if content_elements:
+                sections[section_title] = ' '.join(content_elements)
+
+        # Jika tidak ada heading yang ditemukan, ambil semua teks
+        if not sections:
+            full_text = main_content_div.get_text(strip=True)
+            sections['full_content'] = full_text
+
+        article_content['sections'] = sections
+    else:
+        article_content['sections'] = {"error": "Main content not found"}
+
+    # 4. Ambil References (jika ada)
+    references_section = soup.find('div', class_='html-references')
+    if not references_section and not full_tree:
+        return None
+    if not references_section:
+        references_section = soup.find('section', {'id': 'references'})
+
+    if references_section:
+        references = []
+        ref_items = references_section.find_all('li') or references_section.find_all('p')
+        for ref in ref_items:
+            ref_text = ref.get_text(strip=True)
+            if ref_text:
+                references.append(ref_text)
+        article_content['references'] = references
+    else:
+        article_content['references'] = "References not found"
+
+    return article_content
+
+
+def _iter_html_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith((".html", ".htm", ".html.gz")):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def _read_html(path):
+    if path.endswith(".gz"):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read()
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _search_items_data(html, backend, targeted):
+    _, article_items = parse_search_page(html, backend, targeted)
+    return [parse_search_item(item) for item in article_items]
+
+
+def compare_parsers(paths, backend=None):
+    """
+    Membandingkan parser lama (html.parser, seluruh dokumen) dengan parser
+    terpilih (`backend`, parse terarah) pada korpus fixture. Mengembalikan
+    dict berisi jumlah halaman, waktu parse, speedup, dan daftar file yang
+    hasilnya berbeda.
+    """
+    backend = backend or DEFAULT_BACKEND
+    baseline_seconds = 0.0
+    fast_seconds = 0.0
+    mismatches = []
+    pages = 0
+
+    for path in _iter_html_files(paths):
+        html = _read_html(path)
+        pages += 1
+
+        # Halaman pencarian dibandingkan dengan parser hasil pencarian, sisanya
+        # dengan ekstraksi artikel
+        if 'generic-item' in html:
+            parse = _search_items_data
+        else:
+            parse = extract_article_content
+
+        started = time.perf_counter()
+        baseline = parse(html, BASELINE_BACKEND, targeted=False)
+        baseline_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        fast = parse(html, backend, targeted=True)
+        fast_seconds += time.perf_counter() - started
+
+        if baseline != fast:
+            mismatches.append(path)
+
+    return {
+        "backend": backend,
+        "pages": pages,
+        "baseline_seconds": baseline_seconds,
+        "fast_seconds": fast_seconds,
+        "speedup": baseline_seconds / fast_seconds if fast_seconds else 0.0,
+        "mismatches": mismatches,
+    }
+
+
+if __name__ == "__main__":
+    # Penggunaan: python parsers.py <file.html|folder> [...]
+    if len(sys.argv) < 2:
+        print("Penggunaan: python parsers.py <file.html|folder> [...]")
+        sys.exit(1)
+
+    result = compare_parsers(sys.argv[1:])
+    if not result["pages"]:
+        print("[!] Tidak ada file HTML ditemukan.")
+        sys.exit(1)
+
+    print(f"[*] Backend: {result['backend']} (parse terarah) vs {BASELINE_BACKEND} (parse penuh)")
+    print(f"[*] Halaman: {result['pages']}")
+    print(f"    Parser lama : {result['baseline_seconds'] / result['pages'] * 1000:.1f} ms/halaman")
+    print(f"    Parser baru : {result['fast_seconds'] / result['pages'] * 1000:.1f} ms/halaman")
+    print(f"    Speedup     : {result['speedup']:.2f}x")
+    if result["mismatches"]:
+        print(f"[!] {len(result['mismatches'])} halaman menghasilkan output berbeda:")
+        for path in result["mismatches"]:
+            print(f"    - {path}")
+        sys.exit(1)
+    print("[✓] Output identik untuk semua halaman")
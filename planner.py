@@ -0,0 +1,363 @@
+"""
+Crawl terpartisi: crawl dipecah menjadi partisi (topik, tahun, jurnal) yang
+diklaim oleh worker lewat antrian berbasis lease. Antrian disimpan di SQLite
+sehingga bisa dipakai beberapa proses di satu mesin atau beberapa node yang
+berbagi filesystem (filesystem harus mendukung file locking POSIX).
+
+    python planner.py plan --topics "computer science" physics --years 2021 2025 --limit 500
+    python planner.py work --processes 4        # jalankan di setiap mesin
+    python planner.py status
+    python planner.py merge                     # gabungkan shard menjadi satu dataset
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import main
+from output_writer import JsonlWriter, compact_jsonl, iter_records
+
+
+QUEUE_PENDING = "pending"
+QUEUE_LEASED = "leased"
+QUEUE_DONE = "done"
+QUEUE_FAILED = "failed"
+
+DEFAULT_QUEUE_DB = "output/jobs.db"
+DEFAULT_SHARD_DIR = "output/shards"
+
+
+def partition_id_for(topic, year, journal=None):
+    """
+    ID partisi yang stabil, juga dipakai sebagai nama folder shard.
+    """
+    parts = [topic.replace(' ', '_'), str(year)]
+    if journal:
+        parts.append(journal)
+    return "_".join(parts)
+
+
+def plan_partitions(topics, year_from, year_to, journals=None, limit=1000):
+    """
+    Memecah crawl menjadi satu partisi per topik, per tahun, dan per jurnal
+    (jika `journals` diberikan). `limit` berlaku untuk setiap partisi.
+    """
+    partitions = []
+    for topic in topics:
+        for year in range(year_from, year_to + 1):
+            for journal in (journals or [None]):
+                partitions.append({
+                    "partition_id": partition_id_for(topic, year, journal),
+                    "topic": topic,
+                    "year": year,
+                    "journal": journal,
+                    "limit": limit,
+                })
+    return partitions
+
+
+class WorkQueue:
+    """
+    Antrian partisi berbasis lease. Worker mengklaim partisi untuk
+    `lease_seconds` dan memperpanjang lease selama masih bekerja; partisi yang
+    lease-nya habis (worker mati) bisa diklaim worker lain. Partisi yang gagal
+    dicoba ulang sampai `max_attempts` kali.
+    """
+
+    def __init__(self, db_path=DEFAULT_QUEUE_DB, max_attempts=3):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # Tanpa WAL: WAL butuh shared memory dan tidak aman di filesystem jaringan
+        self.conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=DELETE")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS partitions (
+                partition_id TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                journal TEXT,
+                article_limit INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                output_path TEXT,
+                error TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+
+    def _now(self):
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def add(self, partitions):
+        """
+        Menambahkan partisi ke antrian; partisi yang sudah ada tidak diubah.
+        Mengembalikan jumlah partisi baru.
+        """
+        added = 0
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for partition in partitions:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO partitions "
+                    "(partition_id, topic, year, journal, article_limit, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (partition["partition_id"], partition["topic"], partition["year"],
+                     partition["journal"], partition["limit"], QUEUE_PENDING, self._now())
+                )
+                added += cursor.rowcount
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def claim(self, owner, lease_seconds=600):
+        """
+        Mengklaim satu partisi: pending, atau leased yang lease-nya sudah habis,
+        atau failed yang belum melewati `max_attempts`. Mengembalikan dict
+        partisi, atau None jika tidak ada yang bisa dikerjakan.
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT partition_id, topic, year, journal, article_limit FROM partitions "
+                "WHERE (status = ? OR (status = ? AND lease_expires < ?) OR status = ?) AND attempts < ? "
+                "ORDER BY attempts, rowid LIMIT 1",
+                (QUEUE_PENDING, QUEUE_LEASED, now, QUEUE_FAILED, self.max_attempts)
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                "UPDATE partitions SET status = ?, owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE partition_id = ?",
+                (QUEUE_LEASED, owner, now + lease_seconds, self._now(), row[0])
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        partition_id, topic, year, journal, limit = row
+        return {"partition_id": partition_id, "topic": topic, "year": year,
+                "journal": journal, "limit": limit}
+
+    def renew(self, partition_id, owner, lease_seconds=600):
+        """
+        Memperpanjang lease. Mengembalikan False jika lease sudah diambil alih
+        worker lain.
+        """
+        cursor = self.conn.execute(
+            "UPDATE partitions SET lease_expires = ?, updated_at = ? "
+            "WHERE partition_id = ? AND owner = ? AND status = ?",
+            (time.time() + lease_seconds, self._now(), partition_id, owner, QUEUE_LEASED)
+        )
+        return cursor.rowcount > 0
+
+    def complete(self, partition_id, owner, output_path):
+        self.conn.execute(
+            "UPDATE partitions SET status = ?, output_path = ?, error = NULL, lease_expires = NULL, "
+            "updated_at = ? WHERE partition_id = ? AND owner = ?",
+            (QUEUE_DONE, output_path, self._now(), partition_id, owner)
+        )
+
+    def fail(self, partition_id, owner, error):
+        self.conn.execute(
+            "UPDATE partitions SET status = ?, error = ?, lease_expires = NULL, updated_at = ? "
+            "WHERE partition_id = ? AND owner = ?",
+            (QUEUE_FAILED, str(error), self._now(), partition_id, owner)
+        )
+
+    def status_counts(self):
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM partitions GROUP BY status").fetchall()
+        return dict(rows)
+
+    def done_outputs(self):
+        """
+        Path shard output dari partisi yang sudah selesai, sesuai urutan plan.
+        """
+        rows = self.conn.execute(
+            "SELECT output_path FROM partitions WHERE status = ? AND output_path IS NOT NULL ORDER BY rowid",
+            (QUEUE_DONE,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+def _keep_lease(queue_db, partition_id, owner, lease_seconds, stop, lost):
+    # Koneksi sendiri karena berjalan di thread lain
+    work_queue = WorkQueue(queue_db)
+    try:
+        while not stop.wait(lease_seconds / 3):
+            if not work_queue.renew(partition_id, owner, lease_seconds):
+                # Pemilik baru menulis ke folder yang sama: crawl ini harus berhenti
+                print(f"[!] Lease partisi {partition_id} diambil alih worker lain, crawl dibatalkan")
+                lost.set()
+                break
+    finally:
+        work_queue.close()
+
+
+def run_worker(queue_db=DEFAULT_QUEUE_DB, shard_dir=DEFAULT_SHARD_DIR, owner=None,
+               lease_seconds=600, **scrape_kwargs):
+    """
+    Mengklaim dan mengerjakan partisi sampai antrian habis. Setiap partisi
+    di-crawl dengan `scrape_mdpi` ke folder shard sendiri
+    (`<shard_dir>/<partition_id>/`, termasuk crawl state, cache HTML, profil
+    Chrome, dan indeks pencarian), sehingga worker tidak berbagi file tulis.
+    Jika lease hilang, crawl partisi dibatalkan.
+    Mengembalikan jumlah partisi yang selesai.
+    """
+    owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+    work_queue = WorkQueue(queue_db)
+    completed = 0
+    try:
+        while True:
+            partition = work_queue.claim(owner, lease_seconds)
+            if partition is None:
+                break
+
+            partition_id = partition["partition_id"]
+            print(f"[*] [{owner}] Mengerjakan partisi {partition_id}")
+            stop = threading.Event()
+            lost = threading.Event()
+            keeper = threading.Thread(target=_keep_lease, name="lease-keeper", daemon=True,
+                                      args=(queue_db, partition_id, owner, lease_seconds, stop, lost))
+            keeper.start()
+            partition_dir = os.path.join(shard_dir, partition_id)
+            partition_kwargs = dict(scrape_kwargs)
+            partition_kwargs["output_config"] = dict(scrape_kwargs.get("output_config", {}),
+                                                     output_dir=partition_dir)
+            partition_kwargs["sync_config"] = {"auto_push": False}
+            try:
+                filepath = main.scrape_mdpi(
+                    partition["topic"], 0, partition["limit"],
+                    year_from=partition["year"], year_to=partition["year"], journal=partition["journal"],
+                    abort=lost, **partition_kwargs
+                )
+                if lost.is_set():
+                    print(f"[!] [{owner}] Partisi {partition_id} dilepas (lease hilang)")
+                    continue
+                if filepath is None or not os.path.exists(filepath):
+                    raise RuntimeError("scrape_mdpi tidak menghasilkan output")
+            except Exception as e:
+                print(f"[!] [{owner}] Partisi {partition_id} gagal: {e}")
+                work_queue.fail(partition_id, owner, e)
+            else:
+                work_queue.complete(partition_id, owner, filepath)
+                completed += 1
+                print(f"[✓] [{owner}] Partisi {partition_id} selesai: {filepath}")
+            finally:
+                stop.set()
+                keeper.join()
+    finally:
+        work_queue.close()
+    return completed
+
+
+def merge_shards(shard_paths, output_path, compact_output=True):
+    """
+    Menggabungkan output partisi (folder shard atau JSONL) menjadi satu dataset, membuang artikel duplikat
+    berdasarkan DOI (atau link jika DOI tidak ada). Mengembalikan tuple
+    (output_path, jumlah artikel, jumlah duplikat).
+    """
+    seen = set()
+    duplicates = 0
+    tmp_path = output_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    with JsonlWriter(tmp_path, fsync_every=0) as writer:
+        for shard_path in shard_paths:
+            if not os.path.exists(shard_path):
+                print(f"[!] Shard '{shard_path}' tidak ditemukan, dilewati")
+                continue
+            for record in iter_records(shard_path):
+                key = main.article_key_for(record)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                writer.write(record)
+    os.replace(tmp_path, output_path)
+
+    if compact_output:
+        compact_jsonl(output_path)
+    return output_path, len(seen), duplicates
+
+
+def _worker_process(queue_db, shard_dir, lease_seconds, scrape_kwargs):
+    run_worker(queue_db, shard_dir, lease_seconds=lease_seconds, **scrape_kwargs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl MDPI terpartisi (topik, tahun, jurnal)")
+    parser.add_argument("--queue", default=DEFAULT_QUEUE_DB, help="File SQLite antrian partisi")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = commands.add_parser("plan", help="Membuat partisi dan memasukkannya ke antrian")
+    plan_parser.add_argument("--topics", nargs="+", required=True)
+    plan_parser.add_argument("--years", nargs=2, type=int, metavar=("DARI", "SAMPAI"), required=True)
+    plan_parser.add_argument("--journals", nargs="*", default=None, help="Kode jurnal MDPI, misalnya entropy")
+    plan_parser.add_argument("--limit", type=int, default=1000, help="Jumlah artikel maksimum per partisi")
+
+    work_parser = commands.add_parser("work", help="Mengerjakan partisi dari antrian")
+    work_parser.add_argument("--processes", type=int, default=1, help="Jumlah proses worker di mesin ini")
+    work_parser.add_argument("--shard-dir", default=DEFAULT_SHARD_DIR)
+    work_parser.add_argument("--lease-seconds", type=int, default=600)
+    work_parser.add_argument("--workers", type=int, default=4, help="num_workers scrape_mdpi per proses")
+    work_parser.add_argument("--fetch-mode", default="http", choices=["http", "selenium"])
+    work_parser.add_argument("--depth", default="full", choices=list(main.FIELD_DEPTHS),
+                             help="Kedalaman field artikel (lihat scrape_mdpi)")
+
+    commands.add_parser("status", help="Menampilkan status antrian")
+
+    merge_parser = commands.add_parser("merge", help="Menggabungkan shard dan membuang duplikat")
+    merge_parser.add_argument("--output", default="output/mdpi_merged.jsonl")
+
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        partitions = plan_partitions(args.topics, args.years[0], args.years[1], args.journals, args.limit)
+        work_queue = WorkQueue(args.queue)
+        added = work_queue.add(partitions)
+        work_queue.close()
+        print(f"[✓] {added} partisi baru ditambahkan ke '{args.queue}' (total rencana: {len(partitions)})")
+
+    elif args.command == "work":
+        scrape_kwargs = {"num_workers": args.workers, "fetch_mode": args.fetch_mode, "depth": args.depth}
+        if args.processes <= 1:
+            run_worker(args.queue, args.shard_dir, lease_seconds=args.lease_seconds, **scrape_kwargs)
+        else:
+            processes = [
+                multiprocessing.Process(target=_worker_process, name=f"planner-worker-{i}",
+                                        args=(args.queue, args.shard_dir, args.lease_seconds, scrape_kwargs))
+                for i in range(args.processes)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+    elif args.command == "status":
+        work_queue = WorkQueue(args.queue)
+        counts = work_queue.status_counts()
+        work_queue.close()
+        print(f"[*] Status partisi di '{args.queue}':")
+        for status in (QUEUE_PENDING, QUEUE_LEASED, QUEUE_DONE, QUEUE_FAILED):
+            print(f"    {status}: {counts.get(status, 0)}")
+
+    elif args.command == "merge":
+        work_queue = WorkQueue(args.queue)
+        shard_paths = work_queue.done_outputs()
+        work_queue.close()
+        output_path, total, duplicates = merge_shards(shard_paths, args.output)
+        print(f"[✓] {len(shard_paths)} shard digabung ke '{output_path}': {total} artikel, {duplicates} duplikat dibuang")
@@ -0,0 +1,86 @@
+import threading
+import time
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket yang dipakai bersama oleh semua worker untuk mengatur laju
+    request ke MDPI. Laju naik perlahan selama respons sehat (additive increase)
+    dan turun tajam saat terlihat throttling, halaman error, atau timeout
+    (multiplicative decrease). Throttling juga menghentikan semua request
+    selama `penalty` detik (atau sesuai Retry-After jika diketahui).
+    """
+
+    def __init__(self, rate=1.0, min_rate=0.1, max_rate=4.0, burst=2,
+                 increase=0.05, decrease=0.5, penalty=10.0):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.penalty = penalty
+
+        self.lock = threading.Lock()
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.stats = {"requests": 0, "throttles": 0, "errors": 0, "wait_seconds": 0.0}
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """
+        Menunggu sampai ada token untuk satu request. Mengembalikan lama
+        menunggu (detik).
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.stats["requests"] += 1
+                    self.stats["wait_seconds"] += waited
+                    return waited
+                delay = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def on_success(self):
+        """
+        Respons sehat: naikkan laju sedikit.
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_error(self):
+        """
+        Timeout atau error server: turunkan laju tanpa jeda tambahan.
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.stats["errors"] += 1
+
+    def on_throttle(self, retry_after=None):
+        """
+        Throttling atau halaman challenge: turunkan laju, kosongkan bucket, dan
+        hentikan request selama `retry_after` (default `penalty`) detik.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = 0.0
+            pause = self.penalty if retry_after is None else retry_after
+            self.paused_until = max(self.paused_until, now + pause)
+            self.stats["throttles"] += 1
+
+    def summary(self):
+        with self.lock:
+            return dict(self.stats, rate=self.rate)
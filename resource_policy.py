@@ -0,0 +1,167 @@
+import json
+import threading
+
+
+# Pola URL per jenis resource yang tidak dibutuhkan untuk membaca konten MDPI.
+# Script MDPI sendiri (jQuery, render hasil pencarian) tidak diblokir.
+RESOURCE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg"],
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*adservice.google.*", "*facebook.net*", "*connect.facebook.*",
+        "*hotjar.com*", "*scorecardresearch.com*", "*twitter.com/widgets*", "*platform.twitter.com*",
+        "*linkedin.com/px*", "*clarity.ms*", "*cookielaw.org*", "*onetrust.com*",
+    ],
+    "mathjax": ["*mathjax*", "*MathJax*"],
+    "widgets": ["*altmetric.com*", "*crossmark*", "*plu.mx*", "*scite.ai*", "*addthis.com*"],
+}
+
+# Perkiraan ukuran rata-rata (bytes) resource yang diblokir. Resource yang
+# diblokir tidak pernah diunduh, jadi "bytes yang dihemat" hanya bisa ditaksir.
+ESTIMATED_BYTES = {
+    "Image": 40 * 1024,
+    "Font": 60 * 1024,
+    "Media": 500 * 1024,
+    "Script": 80 * 1024,
+    "Stylesheet": 20 * 1024,
+    "XHR": 5 * 1024,
+    "Fetch": 5 * 1024,
+    "Other": 10 * 1024,
+}
+
+
+class ResourcePolicy:
+    """
+    Kebijakan pemblokiran resource untuk driver Chrome. Setiap kategori di
+    `RESOURCE_PATTERNS` bisa diaktifkan/nonaktifkan, dan `extra_patterns`
+    menambah pola URL lain (wildcard `*` seperti Network.setBlockedURLs).
+    """
+
+    def __init__(self, block=("image", "font", "media", "analytics", "mathjax", "widgets"),
+                 extra_patterns=()):
+        unknown = set(block) - set(RESOURCE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Kategori resource tidak dikenal: {', '.join(sorted(unknown))}")
+        self.block = tuple(block)
+        self.extra_patterns = tuple(extra_patterns)
+
+    @property
+    def blocks_images(self):
+        return "image" in self.block
+
+    def patterns(self):
+        patterns = []
+        for category in self.block:
+            patterns.extend(RESOURCE_PATTERNS[category])
+        patterns.extend(self.extra_patterns)
+        return patterns
+
+
+DEFAULT_RESOURCE_POLICY = ResourcePolicy()
+
+
+def enable_network_logging(chrome_options):
+    """
+    Mengaktifkan performance log Chrome (hanya event Network) agar request
+    yang dimuat dan yang diblokir bisa dihitung per halaman.
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def apply_resource_policy(driver, policy):
+    """
+    Memasang daftar URL yang diblokir lewat CDP. Mengembalikan False jika
+    driver tidak mendukung CDP.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": policy.patterns()})
+        return True
+    except Exception as e:
+        print(f"[!] Gagal memasang kebijakan resource: {e}")
+        return False
+
+
+def collect_page_network(driver):
+    """
+    Membaca (dan mengosongkan) performance log sejak pemanggilan sebelumnya.
+    Mengembalikan dict: jumlah request dan bytes yang dimuat, jumlah request
+    yang diblokir per tipe, dan perkiraan bytes yang dihemat. None jika log
+    tidak tersedia.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+
+    types = {}
+    loaded_requests = 0
+    loaded_bytes = 0
+    blocked = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            types[params.get("requestId")] = params.get("type", "Other")
+        elif method == "Network.loadingFinished":
+            loaded_requests += 1
+            loaded_bytes += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            resource_type = params.get("type") or types.get(params.get("requestId"), "Other")
+            blocked[resource_type] = blocked.get(resource_type, 0) + 1
+
+    return {
+        "requests": loaded_requests,
+        "bytes": loaded_bytes,
+        "blocked": blocked,
+        "blocked_requests": sum(blocked.values()),
+        "estimated_bytes_saved": sum(ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES["Other"]) * count
+                                     for resource_type, count in blocked.items()),
+    }
+
+
+class NetworkUsage:
+    """
+    Akumulasi penggunaan jaringan halaman Selenium per jenis halaman
+    (search/article) untuk ringkasan di akhir run.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = {}
+
+    def reset(self):
+        with self.lock:
+            self.pages = {}
+
+    def add(self, kind, page_stats):
+        with self.lock:
+            totals = self.pages.setdefault(kind, {"pages": 0, "requests": 0, "bytes": 0,
+                                                  "blocked_requests": 0, "estimated_bytes_saved": 0})
+            totals["pages"] += 1
+            for key in ("requests", "bytes", "blocked_requests", "estimated_bytes_saved"):
+                totals[key] += page_stats[key]
+
+    def report(self):
+        with self.lock:
+            pages = {kind: dict(totals) for kind, totals in self.pages.items()}
+        if not pages:
+            return
+        print("[*] Jaringan per halaman Selenium (rata-rata):")
+        for kind, totals in sorted(pages.items()):
+            count = totals["pages"]
+            print(f"    {kind}: {totals['requests'] / count:.0f} request dimuat "
+                  f"({totals['bytes'] / count / 1024:.0f} KB), "
+                  f"{totals['blocked_requests'] / count:.0f} request diblokir "
+                  f"(perkiraan hemat {totals['estimated_bytes_saved'] / count / 1024:.0f} KB) "
+                  f"dari {count} halaman")
+
+
+NETWORK_USAGE = NetworkUsage()
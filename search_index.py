@@ -0,0 +1,251 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from output_writer import iter_records
+
+
+DEFAULT_INDEX_DB = os.path.join("output", "search_index.db")
+
+# Bobot BM25 per kolom teks: title, abstract, keywords, sections
+COLUMN_WEIGHTS = (10.0, 5.0, 5.0, 1.0)
+
+# Urutan kedalaman field (lihat FIELD_DEPTHS di main.py); record tanpa field
+# `depth` berasal dari halaman artikel lengkap
+DEPTH_RANK = {"listing": 0, "abstract": 1, "full": 2}
+
+# Nilai pengganti dari build_article_data yang tidak perlu diindeks
+MISSING_VALUES = {"Abstract not found", "Keywords not found", "References not found"}
+
+
+def _text(value):
+    """
+    Teks yang diindeks dari satu field artikel (string, list, atau dict
+    section -> isi).
+    """
+    if not value:
+        return ""
+    if isinstance(value, dict):
+        return "\n".join(f"{heading}\n{_text(body)}" for heading, body in value.items())
+    if isinstance(value, (list, tuple)):
+        return "; ".join(_text(item) for item in value)
+    return "" if value in MISSING_VALUES else str(value)
+
+
+def _quote_terms(query):
+    # Query bebas yang bukan sintaks FTS5 valid: cari semua kata apa adanya
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+class SearchIndex:
+    """
+    Indeks full-text SQLite FTS5 atas artikel yang sudah di-scrape (title,
+    abstract, keywords, dan teks section). Diperbarui per artikel saat
+    disimpan, sehingga pencarian tidak perlu memuat seluruh output ke memori.
+    Artikel diidentifikasi dengan kunci yang sama dengan output (DOI atau
+    link); menambah artikel yang sama lagi mengganti entri lamanya, kecuali
+    entri lama berasal dari depth yang lebih dalam (misalnya full text tidak
+    diganti hasil run `--depth listing`).
+
+    Secara default setiap artikel langsung di-commit, sama seperti
+    `CrawlState.mark_done`, agar artikel yang tercatat selesai tidak hilang
+    dari indeks saat crash. `commit_every` yang lebih besar hanya untuk
+    membangun indeks sekaligus (`build`), yang bisa diulang.
+    """
+
+    def __init__(self, db_path=DEFAULT_INDEX_DB, commit_every=1):
+        self.db_path = db_path
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Ditulis dari thread write pipeline, dibaca dari thread lain
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY,
+                article_key TEXT NOT NULL UNIQUE,
+                title TEXT,
+                journal TEXT,
+                link TEXT,
+                source TEXT,
+                depth TEXT NOT NULL DEFAULT 'full',
+                indexed_at TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                title, abstract, keywords, sections,
+                tokenize='porter unicode61 remove_diacritics 2'
+            );
+        """)
+        # Indeks lama belum punya kolom depth (semua entrinya full)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(documents)")]
+        if "depth" not in columns:
+            self.conn.execute("ALTER TABLE documents ADD COLUMN depth TEXT NOT NULL DEFAULT 'full'")
+        self.conn.commit()
+
+    def add(self, record, key=None, source=None):
+        """
+        Menambahkan atau memperbarui satu artikel di indeks. `source` adalah
+        path output tempat artikel disimpan (untuk membaca record lengkap).
+        Mengembalikan False jika dilewati karena entri yang ada lebih dalam.
+        """
+        key = key or record.get("link")
+        depth = record.get("depth", "full")
+        values = (_text(record.get("title")), _text(record.get("abstract")),
+                  _text(record.get("keywords")), _text(record.get("full_content")))
+        with self.lock:
+            row = self.conn.execute("SELECT doc_id, depth FROM documents WHERE article_key = ?",
+                                    (key,)).fetchone()
+            if row is not None:
+                doc_id, indexed_depth = row
+                if DEPTH_RANK.get(indexed_depth, 2) > DEPTH_RANK.get(depth, 2):
+                    return False
+                self.conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+                self.conn.execute(
+                    "UPDATE documents SET title = ?, journal = ?, link = ?, source = ?, depth = ?, indexed_at = ? "
+                    "WHERE doc_id = ?",
+                    (record.get("title"), record.get("journal"), record.get("link"), source, depth,
+                     self._now(), doc_id)
+                )
+            else:
+                doc_id = self.conn.execute(
+                    "INSERT INTO documents (article_key, title, journal, link, source, depth, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, record.get("title"), record.get("journal"), record.get("link"), source, depth,
+                     self._now())
+                ).lastrowid
+            self.conn.execute(
+                "INSERT INTO documents_fts (rowid, title, abstract, keywords, sections) VALUES (?, ?, ?, ?, ?)",
+                (doc_id,) + values
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self.conn.commit()
+                self._uncommitted = 0
+        return True
+
+    def search(self, query, limit=10, offset=0):
+        """
+        Pencarian berperingkat (BM25, title paling berbobot). `query` memakai
+        sintaks FTS5 (misalnya `"neural network" AND title:entropy`); query
+        yang bukan sintaks valid dicari sebagai kata-kata biasa. Mengembalikan
+        list dict: key, title, journal, link, source, score, dan snippet
+        (kosong untuk query kosong).
+        """
+        if not query.strip():
+            return []
+        weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+        sql = f"""
+            SELECT d.article_key, d.title, d.journal, d.link, d.source,
+                   bm25(documents_fts, {weights}) AS score,
+                   snippet(documents_fts, -1, '[', ']', '...', 16)
+            FROM documents_fts JOIN documents d ON d.doc_id = documents_fts.rowid
+            WHERE documents_fts MATCH ?
+            ORDER BY score
+            LIMIT ? OFFSET ?
+        """
+        with self.lock:
+            try:
+                rows = self.conn.execute(sql, (query, limit, offset)).fetchall()
+            except sqlite3.OperationalError:
+                try:
+                    rows = self.conn.execute(sql, (_quote_terms(query), limit, offset)).fetchall()
+                except sqlite3.OperationalError:
+                    rows = []
+        return [
+            {"key": key, "title": title, "journal": journal, "link": link, "source": source,
+             "score": round(-score, 4), "snippet": snippet}
+            for key, title, journal, link, source, score, snippet in rows
+        ]
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def flush(self):
+        with self.lock:
+            self.conn.commit()
+            self._uncommitted = 0
+
+    def optimize(self):
+        """
+        Menggabungkan segmen FTS5 (setelah membangun indeks besar sekaligus).
+        """
+        with self.lock:
+            self.conn.execute("INSERT INTO documents_fts (documents_fts) VALUES ('optimize')")
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+    def _now(self):
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def index_output(index, path):
+    """
+    Mengindeks semua artikel dari output yang sudah ada (folder shard atau
+    file JSONL). Mengembalikan jumlah artikel yang diindeks.
+    """
+    from main import article_key_for
+
+    total = 0
+    for record in iter_records(path):
+        index.add(record, key=article_key_for(record), source=path)
+        total += 1
+    index.flush()
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Indeks full-text artikel MDPI hasil scraping")
+    parser.add_argument("--index", default=DEFAULT_INDEX_DB, help="File SQLite indeks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Mengindeks output yang sudah ada")
+    build_parser.add_argument("paths", nargs="+", help="Folder shard atau file JSONL")
+
+    query_parser = commands.add_parser("query", help="Mencari artikel")
+    query_parser.add_argument("query", help='Query FTS5, misalnya: "graph neural" AND keywords:entropy')
+    query_parser.add_argument("--limit", type=int, default=10)
+
+    commands.add_parser("stats", help="Menampilkan jumlah artikel di indeks")
+
+    args = parser.parse_args()
+
+    # `build` bisa diulang jika terputus, jadi commit per batch cukup
+    with SearchIndex(args.index, commit_every=500 if args.command == "build" else 1) as index:
+        if args.command == "build":
+            for path in args.paths:
+                started = time.time()
+                total = index_output(index, path)
+                print(f"[✓] {total} artikel dari '{path}' diindeks dalam {time.time() - started:.1f} detik")
+            index.optimize()
+            print(f"[*] Total di indeks: {index.count()} artikel")
+
+        elif args.command == "query":
+            started = time.perf_counter()
+            hits = index.search(args.query, limit=args.limit)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"[*] {len(hits)} hasil untuk '{args.query}' ({elapsed_ms:.1f} ms)")
+            for rank, hit in enumerate(hits, 1):
+                print(f"    {rank}. [{hit['score']:.2f}] {hit['title']}")
+                print(f"       {hit['key']} - {hit['link']}")
+                print(f"       {hit['snippet']}")
+
+        elif args.command == "stats":
+            print(f"[*] {index.count()} artikel di indeks '{args.index}'")
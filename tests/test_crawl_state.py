@@ -0,0 +1,49 @@
+from crawl_state import STATUS_DONE, STATUS_FAILED, CrawlState
+
+
+def test_resume_returns_unfinished_articles_in_order(tmp_path):
+    db_path = str(tmp_path / "crawl_state.db")
+    state = CrawlState(db_path, "physics_2024-2025")
+    for key in ("a", "b", "c", "d"):
+        assert state.add_pending(key, f"https://www.mdpi.com/{key}", None, {"link": key})
+    state.mark_page_visited(1, 4)
+    state.mark_done("a")
+    state.mark_failed("c", "timeout")
+    state.set_watermark("a", "2025-01-01")
+    state.close()
+
+    # Run berikutnya (setelah crash) dengan run_key yang sama
+    state = CrawlState(db_path, "physics_2024-2025")
+    assert state.is_page_visited(1)
+    assert not state.add_pending("a", "https://www.mdpi.com/a", None, {"link": "a"})
+    assert [key for key, _ in state.retry_candidates()] == ["b", "c", "d"]
+    assert state.retry_candidates(limit=1) == [("b", {"link": "b"})]
+    assert state.count_open() == 3
+    assert state.count(STATUS_DONE) == 1
+    assert state.get_watermark() == {"article_key": "a", "pub_date": "2025-01-01"}
+    state.close()
+
+
+def test_failed_articles_stop_after_max_attempts(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.db"), "run")
+    state.add_pending("a", "https://www.mdpi.com/a", None, {"link": "a"})
+    for _ in range(3):
+        state.mark_failed("a", "timeout")
+
+    assert state.retry_candidates(max_attempts=3) == []
+    assert state.count_open(max_attempts=3) == 0
+    assert state.count(STATUS_FAILED) == 1
+    state.close()
+
+
+def test_run_keys_are_isolated(tmp_path):
+    db_path = str(tmp_path / "crawl_state.db")
+    first = CrawlState(db_path, "physics")
+    second = CrawlState(db_path, "chemistry")
+    first.add_pending("a", "https://www.mdpi.com/a", None, {"link": "a"})
+
+    assert second.add_pending("a", "https://www.mdpi.com/a", None, {"link": "a"})
+    first.mark_done("a")
+    assert second.count_open() == 1
+    first.close()
+    second.close()
@@ -0,0 +1,32 @@
+import pytest
+
+from bench.server import FixtureServer
+from http_fetcher import HttpFetcher
+from parsers import extract_article_content, parse_search_item, parse_search_page
+
+
+@pytest.fixture
+def server():
+    server = FixtureServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_search_and_article_pages_parse_over_http(server):
+    fetcher = HttpFetcher(pool_size=2)
+    try:
+        status_code, html = fetcher.fetch(server.base_url + "/search?q=physics&page_no=1")
+        assert status_code == 200
+        _, items = parse_search_page(html)
+        base_data = [parse_search_item(item, server.base_url) for item in items]
+        assert base_data and all(data["link"].startswith(server.base_url) for data in base_data)
+
+        status_code, html = fetcher.fetch(base_data[0]["link"])
+        assert status_code == 200
+        article_content = extract_article_content(html)
+        assert article_content["abstract"] != "Abstract not found"
+        assert article_content["sections"]
+    finally:
+        fetcher.close()
+    assert server.requests_served == 2
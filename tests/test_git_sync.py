@@ -0,0 +1,66 @@
+import subprocess
+
+from git_sync import GitSync
+
+
+def git(cwd, *args):
+    return subprocess.run(["git"] + list(args), cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+def make_repo(tmp_path):
+    remote = tmp_path / "remote.git"
+    work = tmp_path / "work"
+    git(tmp_path, "init", "--bare", "-b", "master", str(remote))
+    git(tmp_path, "init", "-b", "master", str(work))
+    git(work, "config", "user.email", "scraper@example.com")
+    git(work, "config", "user.name", "scraper")
+    git(work, "remote", "add", "origin", str(remote))
+    (work / "README").write_text("readme\n")
+    git(work, "add", "README")
+    git(work, "commit", "-m", "init")
+    git(work, "push", "origin", "master")
+    return remote, work
+
+
+def test_submit_commits_only_submitted_paths_and_pushes(tmp_path):
+    remote, work = make_repo(tmp_path)
+    (work / "output").mkdir()
+    (work / "output" / "shard.jsonl").write_text('{"link": "a"}\n')
+    (work / "notes.txt").write_text("bukan output\n")
+
+    sync = GitSync(str(work), batch_size=2, batch_seconds=3600)
+    sync.submit([str(work / "output" / "shard.jsonl")])
+    sync.submit([str(work / "output" / "shard.jsonl")])
+    assert sync.close(timeout=30)
+
+    assert sync.stats["commits"] == 1
+    assert sync.stats["articles"] == 2
+    assert sync.stats["pushes"] == 1
+    assert git(remote, "ls-tree", "-r", "--name-only", "master").split() == ["README", "output/shard.jsonl"]
+    assert "notes.txt" in git(work, "status", "--porcelain")
+
+
+def test_close_flushes_pending_batch(tmp_path):
+    remote, work = make_repo(tmp_path)
+    (work / "data.jsonl").write_text("{}\n")
+
+    sync = GitSync(str(work), batch_size=50, batch_seconds=3600)
+    sync.submit([str(work / "data.jsonl")])
+    assert sync.close(timeout=30)
+
+    assert "data.jsonl" in git(remote, "ls-tree", "--name-only", "master").split()
+
+
+def test_failed_push_keeps_local_commit(tmp_path):
+    remote, work = make_repo(tmp_path)
+    git(work, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+    (work / "data.jsonl").write_text("{}\n")
+
+    sync = GitSync(str(work), batch_size=1, backoff=0.01, max_backoff=0.01)
+    sync.submit([str(work / "data.jsonl")])
+    assert sync.close(timeout=30)
+
+    assert sync.stats["commits"] == 1
+    assert sync.stats["pushes"] == 0
+    assert sync.stats["push_failures"] >= 1
+    assert "data.jsonl" in git(work, "ls-tree", "--name-only", "HEAD").split()
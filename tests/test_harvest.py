@@ -0,0 +1,115 @@
+import re
+from datetime import date, timedelta
+
+from crawl_state import CrawlState
+from main import harvest_links
+
+ITEMS_PER_PAGE = 50
+
+
+def pub_date(number):
+    # Nomor artikel lebih besar berarti terbit lebih baru
+    return date(2025, 1, 1) + timedelta(days=number)
+
+
+def search_page(numbers):
+    items = "\n".join(
+        f'<div class="generic-item article-item"><a class="title-link" href="/bench/article/{number}">'
+        f'Article {number}</a><div class="authors">A. Author</div><div class="color-grey-dark">'
+        f'Bench 2025, 1, {number}; https://doi.org/10.3390/bench{number} - '
+        f'{pub_date(number).day} {pub_date(number):%b %Y}</div></div>'
+        for number in numbers
+    )
+    return f'<html><body><div class="article-listing">{items}</div></body></html>'
+
+
+EMPTY_PAGE = '<html><body><div class="article-listing"><p>No results found.</p></div></body></html>'
+
+
+class FakeDriverManager:
+    """
+    Pengganti DriverManager yang menyajikan artikel `newest` sampai 0 sebagai
+    hasil pencarian urut tanggal terbit; halaman di `failing` selalu gagal dimuat.
+    """
+
+    def __init__(self, newest, failing=()):
+        self.numbers = list(range(newest, -1, -1))
+        self.failing = set(failing)
+        self.requested = []
+
+    def run(self, func, url, limiter=None):
+        page = int(re.search(r"page_no=(\d+)", url).group(1))
+        self.requested.append(page)
+        if page in self.failing:
+            return None
+        numbers = self.numbers[(page - 1) * ITEMS_PER_PAGE:page * ITEMS_PER_PAGE]
+        return search_page(numbers) if numbers else EMPTY_PAGE
+
+
+def harvest(state, driver_manager, limit=1000):
+    return harvest_links(driver_manager, state, "bench", 2025, 2025, limit, base_url="", incremental=True)
+
+
+def watermark_key(state):
+    return state.get_watermark()["article_key"]
+
+
+def test_first_run_harvests_everything_and_sets_watermark(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.db"), "bench")
+    driver_manager = FakeDriverManager(59)
+
+    assert harvest(state, driver_manager) == 60
+
+    # Halaman tanpa hasil langsung mengakhiri penelusuran, tanpa dicoba ulang
+    assert driver_manager.requested == [1, 2, 3]
+    assert state.get_watermark() == {"article_key": "10.3390/bench59", "pub_date": str(pub_date(59))}
+    state.close()
+
+
+def test_next_run_stops_at_watermark(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.db"), "bench")
+    harvest(state, FakeDriverManager(99))
+
+    driver_manager = FakeDriverManager(119)
+    assert harvest(state, driver_manager) == 20
+
+    assert driver_manager.requested == [1]
+    assert watermark_key(state) == "10.3390/bench119"
+    state.close()
+
+
+def test_older_pub_date_stops_when_watermark_article_is_gone(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.db"), "bench")
+    state.set_watermark("10.3390/dihapus", str(pub_date(100)))
+
+    assert harvest(state, FakeDriverManager(159)) == 60
+
+    assert watermark_key(state) == "10.3390/bench159"
+    state.close()
+
+
+def test_limit_keeps_watermark_until_gap_is_closed(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.db"), "bench")
+    state.set_watermark("10.3390/bench99", str(pub_date(99)))
+
+    assert harvest(state, FakeDriverManager(159), limit=20) == 20
+    assert watermark_key(state) == "10.3390/bench99"
+
+    assert harvest(state, FakeDriverManager(159)) == 40
+    assert state.count_open() == 60
+    assert watermark_key(state) == "10.3390/bench159"
+    state.close()
+
+
+def test_failed_page_does_not_move_watermark(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.db"), "bench")
+    state.set_watermark("10.3390/bench29", str(pub_date(29)))
+
+    assert harvest(state, FakeDriverManager(149, failing={2})) == ITEMS_PER_PAGE
+    assert watermark_key(state) == "10.3390/bench29"
+
+    # Run berikutnya mengulang dari halaman 1 dan menutup celahnya
+    assert harvest(state, FakeDriverManager(149)) == 70
+    assert state.count_open() == 120
+    assert watermark_key(state) == "10.3390/bench149"
+    state.close()
@@ -0,0 +1,55 @@
+import os
+
+from output_writer import ShardedWriter, _repair_shard, iter_shards, load_manifest, read_article, shard_paths
+
+
+def write_articles(shard_dir, links, shard_size=500):
+    with ShardedWriter(str(shard_dir), shard_size=shard_size) as writer:
+        for link in links:
+            writer.write({"link": link, "title": f"Judul {link}"})
+
+
+def test_repair_shard_truncates_partial_member(tmp_path):
+    write_articles(tmp_path, ["a", "b"])
+    shard_path, index_path = shard_paths(str(tmp_path), 0)
+    size = os.path.getsize(shard_path)
+    # Crash di tengah menulis artikel ketiga: data terpotong, indeks belum ditulis
+    with open(shard_path, "ab") as f:
+        f.write(b"\x1f\x8b\x08\x00terpotong")
+
+    entries = _repair_shard(str(tmp_path), 0)
+
+    assert [entry["key"] for entry in entries] == ["a", "b"]
+    assert os.path.getsize(shard_path) == size
+
+
+def test_repair_shard_drops_index_entry_without_data(tmp_path):
+    write_articles(tmp_path, ["a", "b"])
+    shard_path, index_path = shard_paths(str(tmp_path), 0)
+    entries = _repair_shard(str(tmp_path), 0)
+    # Data artikel kedua hilang sebagian (misalnya fsync belum selesai)
+    with open(shard_path, "r+b") as f:
+        f.truncate(entries[1]["offset"] + 5)
+    with open(index_path, "a", encoding="utf-8") as f:
+        f.write('{"key": "c", "off')
+
+    entries = _repair_shard(str(tmp_path), 0)
+
+    assert [entry["key"] for entry in entries] == ["a"]
+    assert os.path.getsize(shard_path) == entries[0]["length"]
+    with open(index_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+
+
+def test_writer_resumes_after_repair(tmp_path):
+    write_articles(tmp_path, ["a", "b", "c"], shard_size=2)
+    shard_path, _ = shard_paths(str(tmp_path), 1)
+    with open(shard_path, "ab") as f:
+        f.write(b"sampah")
+
+    write_articles(tmp_path, ["d", "e"], shard_size=2)
+
+    assert [record["link"] for record in iter_shards(str(tmp_path))] == ["a", "b", "c", "d", "e"]
+    manifest = load_manifest(str(tmp_path))
+    assert read_article(str(tmp_path), "d", manifest)["title"] == "Judul d"
+    assert manifest["d"][0] == shard_path
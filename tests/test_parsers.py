@@ -0,0 +1,26 @@
+import pytest
+
+from bench.server import FIXTURES_DIR
+from parsers import BASELINE_BACKEND, compare_parsers, extract_article_content
+
+# Halaman tanpa container utama: parse terarah harus jatuh ke parse penuh
+FALLBACK_PAGES = [
+    '<html><body><article><section id="abstract"><p>Abstract Short text.</p></section>'
+    '<p>Body paragraph.</p><section id="references"><li>Ref 1</li></section></article></body></html>',
+    '<html><body><div class="art-abstract">Abstract Only abstract</div></body></html>',
+    '<html><body><p>Bukan halaman artikel</p></body></html>',
+]
+
+
+def test_targeted_parse_matches_full_parse_on_fixtures():
+    result = compare_parsers([FIXTURES_DIR])
+
+    assert result["pages"] > 0
+    assert result["mismatches"] == []
+
+
+@pytest.mark.parametrize("html", FALLBACK_PAGES)
+def test_targeted_parse_falls_back_to_full_parse(html):
+    targeted = extract_article_content(html, targeted=True)
+
+    assert targeted == extract_article_content(html, BASELINE_BACKEND, targeted=False)
@@ -0,0 +1,46 @@
+import glob
+import os
+
+import main
+from bench.server import FIXTURES_DIR
+from parsers import extract_article_content_timed
+
+CRASH_MARKER = "<!-- crash parser -->"
+
+
+def crashing_parse(html):
+    # Mensimulasikan halaman yang membuat proses parser mati (misalnya segfault lxml)
+    if CRASH_MARKER in html:
+        os._exit(1)
+    return extract_article_content_timed(html)
+
+
+class PageCache:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url):
+        return self.pages.get(url)
+
+    def put(self, url, html, kind="article"):
+        pass
+
+
+def test_parser_crash_fails_only_the_crashing_article(monkeypatch):
+    monkeypatch.setattr(main, "extract_article_content_timed", crashing_parse)
+    with open(sorted(glob.glob(os.path.join(FIXTURES_DIR, "article_*.html")))[0], encoding="utf-8") as f:
+        good_page = f.read()
+    links = [f"https://www.mdpi.com/article/{i}" for i in range(8)]
+    pages = {link: good_page for link in links}
+    pages[links[2]] = CRASH_MARKER + good_page
+
+    results = []
+    pipeline = main.ArticlePipeline(2, on_result=results.append, parse_workers=2, cache=PageCache(pages))
+    for link in links:
+        pipeline.submit(link, {"title": link, "authors": "", "journal": "", "link": link})
+    pipeline.close()
+
+    assert [data["link"] for data in results] == links
+    failed = [data["link"] for data in results if main.is_error_content(data)]
+    assert failed == [links[2]]
+    assert pipeline.parse_stats["errors"] == 1
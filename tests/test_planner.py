@@ -0,0 +1,62 @@
+import time
+
+from planner import QUEUE_DONE, WorkQueue, plan_partitions
+
+
+def make_queue(tmp_path, **kwargs):
+    queue = WorkQueue(str(tmp_path / "jobs.db"), **kwargs)
+    queue.add(plan_partitions(["physics"], 2024, 2025, limit=10))
+    return queue
+
+
+def test_claim_hands_out_each_partition_once(tmp_path):
+    queue = make_queue(tmp_path)
+
+    first = queue.claim("worker-1", lease_seconds=60)
+    second = queue.claim("worker-2", lease_seconds=60)
+
+    assert {first["partition_id"], second["partition_id"]} == {"physics_2024", "physics_2025"}
+    assert queue.claim("worker-3", lease_seconds=60) is None
+    assert queue.add(plan_partitions(["physics"], 2024, 2025)) == 0
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.add(plan_partitions(["chemistry"], 2024, 2024))
+    partition = queue.claim("worker-1", lease_seconds=0.2)
+    queue.claim("worker-1", lease_seconds=60)
+    queue.claim("worker-1", lease_seconds=60)
+
+    assert queue.claim("worker-2", lease_seconds=60) is None
+    time.sleep(0.3)
+    reclaimed = queue.claim("worker-2", lease_seconds=60)
+
+    assert reclaimed["partition_id"] == partition["partition_id"]
+    # Worker lama tidak bisa memperpanjang atau menyelesaikan partisi yang diambil alih
+    assert not queue.renew(partition["partition_id"], "worker-1")
+    queue.complete(partition["partition_id"], "worker-1", "lama")
+    assert queue.done_outputs() == []
+    assert queue.renew(partition["partition_id"], "worker-2")
+
+
+def test_failed_partition_is_retried_until_max_attempts(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    queue.claim("worker-1")
+    partition = queue.claim("worker-1")
+    queue.fail(partition["partition_id"], "worker-1", "timeout")
+
+    retried = queue.claim("worker-2")
+    assert retried["partition_id"] == partition["partition_id"]
+    queue.fail(partition["partition_id"], "worker-2", "timeout")
+
+    assert queue.claim("worker-3") is None
+    assert queue.status_counts() == {"failed": 1, "leased": 1}
+
+
+def test_complete_records_output(tmp_path):
+    queue = make_queue(tmp_path)
+    partition = queue.claim("worker-1")
+    queue.complete(partition["partition_id"], "worker-1", "output/shards/physics_2024")
+
+    assert queue.status_counts()[QUEUE_DONE] == 1
+    assert queue.done_outputs() == ["output/shards/physics_2024"]
@@ -0,0 +1,46 @@
+import time
+
+from rate_limiter import AdaptiveRateLimiter
+
+
+def test_burst_then_paced_by_rate():
+    limiter = AdaptiveRateLimiter(rate=20.0, max_rate=20.0, burst=2)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    waited = limiter.acquire()
+
+    assert 0.03 <= waited <= 0.2
+    assert limiter.summary()["requests"] == 3
+
+
+def test_rate_increases_on_success_up_to_max():
+    limiter = AdaptiveRateLimiter(rate=1.0, max_rate=1.2, increase=0.1)
+    for _ in range(5):
+        limiter.on_success()
+
+    assert limiter.summary()["rate"] == 1.2
+
+
+def test_error_decreases_rate_down_to_min():
+    limiter = AdaptiveRateLimiter(rate=1.0, min_rate=0.3, decrease=0.5)
+    limiter.on_error()
+    assert limiter.summary()["rate"] == 0.5
+    limiter.on_error()
+
+    summary = limiter.summary()
+    assert summary["rate"] == 0.3
+    assert summary["errors"] == 2
+
+
+def test_throttle_pauses_all_requests():
+    limiter = AdaptiveRateLimiter(rate=50.0, max_rate=50.0, burst=5)
+    limiter.on_throttle(retry_after=0.2)
+
+    started = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - started >= 0.2
+    summary = limiter.summary()
+    assert summary["rate"] == 25.0
+    assert summary["throttles"] == 1
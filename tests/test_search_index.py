@@ -0,0 +1,57 @@
+import sqlite3
+
+from search_index import SearchIndex
+
+
+def record(key, depth=None, **fields):
+    data = {"title": f"Article {key}", "journal": "Entropy", "link": f"https://www.mdpi.com/{key}",
+            "abstract": "Abstract not found", "keywords": "Keywords not found", "full_content": {}}
+    data.update(fields)
+    if depth:
+        data["depth"] = depth
+    return data
+
+
+def test_search_ranks_title_matches_first(tmp_path):
+    with SearchIndex(str(tmp_path / "index.db")) as index:
+        index.add(record("a", abstract="A graph neural network for entropy estimation"), key="a")
+        index.add(record("b", title="Graph neural networks revisited"), key="b")
+        index.add(record("c", full_content={"Intro": "Nothing about it"}), key="c")
+
+        hits = index.search("graph neural")
+
+    assert [hit["key"] for hit in hits] == ["b", "a"]
+
+
+def test_shallower_record_does_not_replace_full_text(tmp_path):
+    with SearchIndex(str(tmp_path / "index.db")) as index:
+        assert index.add(record("a", full_content={"Methods": "quantum annealing schedule"}), key="a")
+        assert not index.add(record("a", depth="listing", title="Listing title"), key="a")
+        assert index.add(record("b", depth="listing"), key="b")
+        assert index.add(record("b", abstract="now with abstract", depth="abstract"), key="b")
+
+        assert [hit["key"] for hit in index.search("annealing")] == ["a"]
+        assert index.search("Listing") == []
+        assert [hit["key"] for hit in index.search("abstract")] == ["b"]
+        assert index.count() == 2
+
+
+def test_invalid_and_empty_queries_do_not_raise(tmp_path):
+    with SearchIndex(str(tmp_path / "index.db")) as index:
+        index.add(record("a", abstract="C++ (and C#) compilers"), key="a")
+
+        assert [hit["key"] for hit in index.search('compilers AND (')] == ["a"]
+        assert index.search('"') == []
+        assert index.search("   ") == []
+
+
+def test_each_article_is_committed_immediately(tmp_path):
+    db_path = str(tmp_path / "index.db")
+    index = SearchIndex(db_path)
+    index.add(record("a"), key="a")
+
+    # Terlihat dari koneksi lain tanpa flush/close (misalnya setelah crash)
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT article_key FROM documents").fetchall() == [("a",)]
+    conn.close()
+    index.close()